@@ -318,7 +318,7 @@ Be thorough but concise in your reasoning. Provide actionable insights.
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def save_filter_results(self, results: List[FilterResult]) -> int:
         """
@@ -356,6 +356,12 @@ Be thorough but concise in your reasoning. Provide actionable insights.
             )
             """)
             
+            # Covering index for approved-job lookups (decision filter, newest first)
+            cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_filter_results_decision
+            ON filter_results(decision, processed_at DESC, job_id)
+            """)
+            
             for result in results:
                 try:
                     # Check if result already exists
@@ -423,7 +429,7 @@ Be thorough but concise in your reasoning. Provide actionable insights.
                 conn.rollback()
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
         
         return saved_count
     
@@ -491,7 +497,7 @@ Be thorough but concise in your reasoning. Provide actionable insights.
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def filter_and_save_jobs(self, job_ids: List[int], criteria: FilterCriteria,
                                   provider: Optional[str] = None) -> Dict[str, Any]:
@@ -9,7 +9,7 @@ import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 import aiohttp
 
@@ -32,6 +32,39 @@ class LLMResponse:
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
+    _sessions: Optional[Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the provider's pooled HTTP session for the running event loop.
+        
+        A session only works on the loop that created it, and the shared manager
+        is used from the UI's background loop and from asyncio.run() callers at
+        the same time, so each loop keeps its own session.
+        """
+        loop = asyncio.get_running_loop()
+        if self._sessions is None:
+            self._sessions = {}
+        
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._discard_stale_sessions()
+            session = self._sessions[loop] = aiohttp.ClientSession()
+        return session
+    
+    def _discard_stale_sessions(self) -> None:
+        """Drop sessions whose event loop has been closed; their connections went with it."""
+        for loop, session in list(self._sessions.items()):
+            if loop.is_closed():
+                del self._sessions[loop]
+                session.detach()
+    
+    async def aclose(self) -> None:
+        """Close the provider's HTTP session for the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None) if self._sessions else None
+        if session is not None:
+            await session.close()
+    
     @abstractmethod
     async def generate_text(self, prompt: str, system_prompt: str = "", **kwargs) -> LLMResponse:
         """Generate text response."""
@@ -51,6 +84,19 @@ class LLMProvider(ABC):
     def get_model_name(self) -> str:
         """Get the model name being used."""
         pass
+    
+    async def astream_text(self, prompt: str, system_prompt: str = "", **kwargs) -> AsyncIterator[str]:
+        """Stream a text response in chunks; providers without streaming yield it whole."""
+        response = await self.generate_text(prompt, system_prompt, **kwargs)
+        if response.error:
+            raise RuntimeError(response.error)
+        yield response.content
+    
+    async def aprobe(self) -> int:
+        """Request the provider's probe endpoint over the pooled session; return the HTTP status."""
+        session = self._get_session()
+        async with session.get(self.probe_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            return response.status
 
 class OpenRouterProvider(LLMProvider):
     """OpenRouter API provider for various LLM models."""
@@ -58,6 +104,7 @@ class OpenRouterProvider(LLMProvider):
     def __init__(self, config: LLMConfig):
         self.config = config
         self.base_url = "https://openrouter.ai/api/v1"
+        self.probe_url = f"{self.base_url}/models"
         self.headers = {
             "Authorization": f"Bearer {config.openrouter_api_key}",
             "HTTP-Referer": "http://localhost:8501",
@@ -65,6 +112,20 @@ class OpenRouterProvider(LLMProvider):
             "Content-Type": "application/json"
         }
     
+    def _build_payload(self, prompt: str, system_prompt: str = "", **kwargs) -> Dict[str, Any]:
+        """Build the chat completions request body."""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        return {
+            "model": self.config.default_model,
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens)
+        }
+    
     async def generate_text(self, prompt: str, system_prompt: str = "", **kwargs) -> LLMResponse:
         """Generate text response using OpenRouter API."""
         if not self.config.openrouter_api_key:
@@ -74,41 +135,31 @@ class OpenRouterProvider(LLMProvider):
             )
         
         try:
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            payload = {
-                "model": self.config.default_model,
-                "messages": messages,
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens)
-            }
+            payload = self._build_payload(prompt, system_prompt, **kwargs)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data["choices"][0]["message"]["content"]
-                        
-                        return LLMResponse(
-                            success=True,
-                            content=content,
-                            model=data.get("model", self.config.default_model),
-                            usage=data.get("usage", {}),
-                            finish_reason=data["choices"][0].get("finish_reason")
-                        )
-                    else:
-                        error_text = await response.text()
-                        return LLMResponse(
-                            success=False,
-                            error=f"OpenRouter API error {response.status}: {error_text}"
-                        )
+            session = self._get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=self.headers,
+                json=payload
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    content = data["choices"][0]["message"]["content"]
+                    
+                    return LLMResponse(
+                        success=True,
+                        content=content,
+                        model=data.get("model", self.config.default_model),
+                        usage=data.get("usage", {}),
+                        finish_reason=data["choices"][0].get("finish_reason")
+                    )
+                else:
+                    error_text = await response.text()
+                    return LLMResponse(
+                        success=False,
+                        error=f"OpenRouter API error {response.status}: {error_text}"
+                    )
                         
         except Exception as e:
             logger.error(f"Error calling OpenRouter API: {e}")
@@ -117,6 +168,39 @@ class OpenRouterProvider(LLMProvider):
                 error=f"OpenRouter API error: {str(e)}"
             )
     
+    async def astream_text(self, prompt: str, system_prompt: str = "", **kwargs) -> AsyncIterator[str]:
+        """Stream a text response from OpenRouter's server-sent events."""
+        if not self.config.openrouter_api_key:
+            raise RuntimeError("OpenRouter API key not configured")
+        
+        payload = self._build_payload(prompt, system_prompt, **kwargs)
+        payload["stream"] = True
+        
+        session = self._get_session()
+        async with session.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise RuntimeError(f"OpenRouter API error {response.status}: {error_text}")
+            
+            async for line in response.content:
+                # Skip blank lines and keep-alive comments such as ": OPENROUTER PROCESSING"
+                line = line.strip()
+                if not line.startswith(b"data:"):
+                    continue
+                
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    break
+                
+                chunk = json.loads(data)
+                content = chunk["choices"][0].get("delta", {}).get("content")
+                if content:
+                    yield content
+    
     async def generate_structured_response(self, prompt: str, system_prompt: str = "", response_format: Dict[str, str] = None, **kwargs) -> LLMResponse:
         """Generate structured response using OpenRouter API."""
         
@@ -164,6 +248,19 @@ class OllamaProvider(LLMProvider):
     def __init__(self, config: LLMConfig):
         self.config = config
         self.base_url = config.ollama_base_url
+        self.probe_url = f"{self.base_url}/api/tags"
+    
+    def _build_payload(self, prompt: str, system_prompt: str = "", stream: bool = False, **kwargs) -> Dict[str, Any]:
+        """Build the /api/generate request body."""
+        return {
+            "model": self.config.local_llm_model,
+            "prompt": f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
+            "stream": stream,
+            "options": {
+                "temperature": kwargs.get("temperature", self.config.temperature),
+                "num_predict": kwargs.get("max_tokens", self.config.max_tokens)
+            }
+        }
     
     async def generate_text(self, prompt: str, system_prompt: str = "", **kwargs) -> LLMResponse:
         """Generate text response using Ollama."""
@@ -174,36 +271,28 @@ class OllamaProvider(LLMProvider):
             )
         
         try:
-            payload = {
-                "model": self.config.local_llm_model,
-                "prompt": f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
-                "stream": False,
-                "options": {
-                    "temperature": kwargs.get("temperature", self.config.temperature),
-                    "num_predict": kwargs.get("max_tokens", self.config.max_tokens)
-                }
-            }
+            payload = self._build_payload(prompt, system_prompt, stream=False, **kwargs)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        return LLMResponse(
-                            success=True,
-                            content=data.get("response", ""),
-                            model=self.config.local_llm_model,
-                            finish_reason="stop" if data.get("done") else "length"
-                        )
-                    else:
-                        error_text = await response.text()
-                        return LLMResponse(
-                            success=False,
-                            error=f"Ollama API error {response.status}: {error_text}"
-                        )
+            session = self._get_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=payload
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    
+                    return LLMResponse(
+                        success=True,
+                        content=data.get("response", ""),
+                        model=self.config.local_llm_model,
+                        finish_reason="stop" if data.get("done") else "length"
+                    )
+                else:
+                    error_text = await response.text()
+                    return LLMResponse(
+                        success=False,
+                        error=f"Ollama API error {response.status}: {error_text}"
+                    )
                         
         except Exception as e:
             logger.error(f"Error calling Ollama API: {e}")
@@ -212,6 +301,31 @@ class OllamaProvider(LLMProvider):
                 error=f"Ollama API error: {str(e)}"
             )
     
+    async def astream_text(self, prompt: str, system_prompt: str = "", **kwargs) -> AsyncIterator[str]:
+        """Stream a text response from Ollama's newline-delimited JSON."""
+        payload = self._build_payload(prompt, system_prompt, stream=True, **kwargs)
+        
+        session = self._get_session()
+        async with session.post(
+            f"{self.base_url}/api/generate",
+            json=payload
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise RuntimeError(f"Ollama API error {response.status}: {error_text}")
+            
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+    
     async def generate_structured_response(self, prompt: str, system_prompt: str = "", response_format: Dict[str, str] = None, **kwargs) -> LLMResponse:
         """Generate structured response using Ollama."""
         
@@ -257,6 +371,14 @@ class OllamaProvider(LLMProvider):
     def get_model_name(self) -> str:
         """Get the model name being used."""
         return self.config.local_llm_model
+    
+    async def alist_models(self) -> List[str]:
+        """List the locally pulled models via /api/tags over the pooled session."""
+        session = self._get_session()
+        async with session.get(self.probe_url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            response.raise_for_status()
+            data = await response.json()
+        return [model.get("name", "") for model in data.get("models", [])]
 
 class LLMManager:
     """Main LLM manager that coordinates different providers."""
@@ -264,6 +386,8 @@ class LLMManager:
     def __init__(self):
         self.config = get_llm_config()
         self.providers = {}
+        self._semaphores = {}
+        self._probe_providers = {}
         self._initialize_providers()
     
     def _initialize_providers(self):
@@ -284,6 +408,68 @@ class LLMManager:
                 available.append(name)
         return available
     
+    def get_provider(self, name: Optional[str] = None) -> Optional[LLMProvider]:
+        """Get a provider by name, or the primary provider when no name is given."""
+        if name is None:
+            return self.get_primary_provider()
+        return self.providers.get(name)
+    
+    async def aprobe(self, name: str) -> int:
+        """
+        Probe a provider's endpoint and return the HTTP status code.
+        
+        Providers that are not enabled (e.g. Ollama before USE_LOCAL_LLM is set)
+        get a standalone instance that is kept so its connection pool is reused.
+        """
+        return await self._get_probe_provider(name).aprobe()
+    
+    async def alist_models(self, name: str = "ollama") -> List[str]:
+        """List the models a local provider has available (Ollama only)."""
+        return await self._get_probe_provider(name).alist_models()
+    
+    def _get_probe_provider(self, name: str) -> LLMProvider:
+        """Get a provider for health checks, whether or not it is enabled."""
+        provider = self.providers.get(name)
+        if provider is None:
+            provider = self._probe_providers.get(name)
+            if provider is None:
+                provider_class = {"openrouter": OpenRouterProvider, "ollama": OllamaProvider}[name]
+                provider = self._probe_providers[name] = provider_class(self.config)
+        return provider
+    
+    async def aclose(self) -> None:
+        """Close every provider's HTTP session (probe-only ones included) for the running event loop."""
+        providers = [*self.providers.values(), *self._probe_providers.values()]
+        await asyncio.gather(*(provider.aclose() for provider in providers))
+    
+    def get_semaphore(self, name: str) -> asyncio.Semaphore:
+        """
+        Get the concurrency limit for a provider on the running event loop.
+        
+        Ollama serves OLLAMA_NUM_PARALLEL requests at a time and queues the rest,
+        so extra in-flight requests only wait here instead of timing out there.
+        Semaphores are bound to a loop, so each running loop keeps its own set.
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            # Forget loops that asyncio.run() has already closed
+            for stale_loop in [l for l in self._semaphores if l.is_closed()]:
+                del self._semaphores[stale_loop]
+            semaphores = self._semaphores[loop] = {}
+        
+        if name not in semaphores:
+            limits = {
+                "openrouter": self.config.openrouter_concurrency,
+                "ollama": self.config.ollama_concurrency
+            }
+            semaphores[name] = asyncio.Semaphore(max(1, limits.get(name, 1)))
+        return semaphores[name]
+    
+    def _provider_name(self, provider: LLMProvider) -> str:
+        """Name under which an enabled provider is registered."""
+        return next(name for name, p in self.providers.items() if p is provider)
+    
     def get_primary_provider(self) -> Optional[LLMProvider]:
         """Get the primary provider to use."""
         # Prefer OpenRouter if available
@@ -306,7 +492,49 @@ class LLMManager:
                 error="No LLM providers available"
             )
         
-        return await provider.generate_text(prompt, system_prompt, **kwargs)
+        async with self.get_semaphore(self._provider_name(provider)):
+            return await provider.generate_text(prompt, system_prompt, **kwargs)
+    
+    async def generate(self, messages: List[Dict[str, str]], provider: Optional[str] = None, **kwargs) -> LLMResponse:
+        """Generate a reply to chat-style messages using the named (or primary) provider."""
+        target = self.get_provider(provider)
+        
+        if not target:
+            return LLMResponse(
+                success=False,
+                error=f"LLM provider '{provider}' is not configured" if provider else "No LLM providers available"
+            )
+        
+        name = provider or self._provider_name(target)
+        prompt, system_prompt = self._split_messages(messages)
+        
+        async with self.get_semaphore(name):
+            return await target.generate_text(prompt, system_prompt, **kwargs)
+    
+    async def astream_generate(self, messages: List[Dict[str, str]], provider: Optional[str] = None, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream a reply to chat-style messages using the named (or primary) provider.
+        
+        Yields text chunks as they arrive; provider errors are raised.
+        """
+        target = self.get_provider(provider)
+        
+        if not target:
+            raise RuntimeError(f"LLM provider '{provider}' is not configured" if provider else "No LLM providers available")
+        
+        name = provider or self._provider_name(target)
+        prompt, system_prompt = self._split_messages(messages)
+        
+        async with self.get_semaphore(name):
+            async for chunk in target.astream_text(prompt, system_prompt, **kwargs):
+                yield chunk
+    
+    @staticmethod
+    def _split_messages(messages: List[Dict[str, str]]) -> Tuple[str, str]:
+        """Split chat messages into (prompt, system_prompt) for the provider API."""
+        system_prompt = "\n\n".join(m["content"] for m in messages if m.get("role") == "system")
+        prompt = "\n\n".join(m["content"] for m in messages if m.get("role") != "system")
+        return prompt, system_prompt
     
     async def generate_structured_response(self, prompt: str, system_prompt: str = "", response_format: Dict[str, str] = None, **kwargs) -> LLMResponse:
         """Generate structured response using the primary provider."""
@@ -318,7 +546,8 @@ class LLMManager:
                 error="No LLM providers available"
             )
         
-        return await provider.generate_structured_response(prompt, system_prompt, response_format, **kwargs)
+        async with self.get_semaphore(self._provider_name(provider)):
+            return await provider.generate_structured_response(prompt, system_prompt, response_format, **kwargs)
     
     def get_provider_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about available providers."""
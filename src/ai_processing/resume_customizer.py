@@ -439,7 +439,7 @@ Return only the customized bullet points (one per line, starting with "-"), no e
             logger.error(f"Error saving customization result: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def get_customization_for_job(self, job_id: int) -> Optional[CustomizationResult]:
         """Get existing customization result for a job."""
@@ -486,7 +486,7 @@ Return only the customized bullet points (one per line, starting with "-"), no e
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def batch_customize_resumes(self, job_ids: List[int]) -> Dict[int, Optional[CustomizationResult]]:
         """Customize resumes for multiple jobs in batch."""
@@ -573,7 +573,7 @@ Return only the customized bullet points (one per line, starting with "-"), no e
             return {job_id: None for job_id in job_ids}
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
 
 def create_customization_request_from_job(job_data: Dict[str, Any]) -> CustomizationRequest:
     """Create a customization request from job data dictionary."""
@@ -6,32 +6,104 @@ contacts, and tracking information.
 """
 
 import sqlite3
+import itertools
 import json
+import queue
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns written by DatabaseManager.insert_jobs, in row tuple order
+JOB_INSERT_COLUMNS = (
+    'title', 'company', 'location', 'description', 'url', 'source_url',
+    'salary_range', 'job_type', 'posted_date', 'tags', 'source', 'job_id',
+    'employment_type', 'experience_level', 'created_at'
+)
+
+# Rows per multi-row INSERT, keeping bound parameters under SQLite's 999 limit
+SQLITE_MAX_VARIABLES = 999
+INSERT_ROWS_PER_STATEMENT = SQLITE_MAX_VARIABLES // len(JOB_INSERT_COLUMNS)
+
+@lru_cache(maxsize=8)
+def _build_jobs_insert_query(row_count: int) -> str:
+    """Build an INSERT OR IGNORE statement with row_count VALUES tuples."""
+    row_placeholders = '(' + ', '.join('?' * len(JOB_INSERT_COLUMNS)) + ')'
+    return (
+        f"INSERT OR IGNORE INTO jobs ({', '.join(JOB_INSERT_COLUMNS)}) "
+        f"VALUES {', '.join([row_placeholders] * row_count)}"
+    )
+
 class DatabaseManager:
     """Manages SQLite database operations for the job application system."""
     
-    def __init__(self, db_path: str = "data/job_applications.db"):
+    def __init__(self, db_path: str = "data/job_applications.db", pool_size: int = 5):
         """Initialize database manager with path to SQLite database."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._wal_enabled = False
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
         self.init_database()
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory for dict-like access."""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get database connection with row factory for dict-like access.
+        
+        A previously released connection is reused when one is available,
+        otherwise a new connection is opened.
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         return conn
     
+    def release_connection(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            # Connection was already closed by the caller
+            pass
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of a with block."""
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.release_connection(conn)
+    
+    def apply_write_pragmas(self, conn: sqlite3.Connection) -> None:
+        """
+        Tune a connection for batched writes.
+        
+        WAL mode is stored in the database file, so it is only switched on
+        once per manager. The remaining pragmas are per-connection.
+        """
+        if not self._wal_enabled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled = True
+        
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+    
     def init_database(self) -> None:
         """Initialize database with all required tables."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             # Jobs table - stores scraped job postings
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -122,19 +194,94 @@ class DatabaseManager:
                 )
             """)
             
+            # Feed cache table - HTTP validators and parsed entries per scraped feed URL
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    entries TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Generated emails table - AI-drafted outreach emails awaiting review
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS generated_emails (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id INTEGER NOT NULL,
+                    contact_email TEXT NOT NULL,
+                    contact_name TEXT,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    template_used TEXT,
+                    personalization_score REAL,
+                    generation_notes TEXT,
+                    status TEXT DEFAULT 'draft',
+                    ready_for_export INTEGER DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (job_id) REFERENCES jobs (id)
+                )
+            """)
+            
+            # Columns added since generated_emails was first created
+            self._add_missing_columns(conn, "generated_emails", {
+                "status": "TEXT DEFAULT 'draft'",
+                "ready_for_export": "INTEGER DEFAULT 0",
+                # ALTER TABLE cannot add a CURRENT_TIMESTAMP default; NULL until first edit
+                "updated_at": "TIMESTAMP"
+            })
+            
+            # Export readiness is tracked only by ready_for_export; fold in the old 'ready' status
+            conn.execute("""
+                UPDATE generated_emails SET ready_for_export = 1, status = 'draft'
+                WHERE status = 'ready'
+            """)
+            
             # Create indexes for better performance
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_company ON contacts(company)")
             
+            # Email queue: newest-first ordering and the template/score filters
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_generated_emails_created ON generated_emails(created_at DESC)")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_generated_emails_template_score
+                ON generated_emails(template_used, personalization_score)
+            """)
+            
+            # Partial index: the export queue is a scan of just the ready emails
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_generated_emails_ready
+                ON generated_emails(ready_for_export) WHERE ready_for_export = 1
+            """)
+            
+            # LinkedIn job IDs are unique when present; lets INSERT OR IGNORE dedupe on them
+            try:
+                conn.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS ux_jobs_jobid
+                    ON jobs(job_id) WHERE job_id IS NOT NULL
+                """)
+            except sqlite3.IntegrityError as e:
+                logger.warning(f"Could not create unique job_id index, duplicate job IDs exist: {e}")
+            
             conn.commit()
             logger.info("Database initialized successfully")
     
+    def _add_missing_columns(self, conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
+        """Add any of the given columns (name -> definition) that an existing table lacks."""
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns.items():
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+                logger.info(f"Added column {table}.{name}")
+    
     # Job operations
     def insert_job(self, job_data: Dict[str, Any]) -> int:
         """Insert a new job posting into the database."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 INSERT OR IGNORE INTO jobs 
                 (title, company, location, description, url, source_url, 
@@ -154,6 +301,39 @@ class DatabaseManager:
             ))
             return cursor.lastrowid
     
+    def insert_jobs(self, jobs_data: List[Dict[str, Any]]) -> int:
+        """
+        Insert several job postings in a single transaction.
+        
+        Rows go in as multi-row INSERT OR IGNORE statements, so postings matching an
+        existing url (or job_id, via its unique index) are skipped by SQLite.
+        Returns the number of jobs actually inserted.
+        """
+        if not jobs_data:
+            return 0
+        
+        rows = [
+            tuple(
+                json.dumps(job_data.get('tags', [])) if column == 'tags' else job_data.get(column)
+                for column in JOB_INSERT_COLUMNS
+            )
+            for job_data in jobs_data
+        ]
+        
+        inserted_count = 0
+        with self.connection() as conn:
+            self.apply_write_pragmas(conn)
+            with conn:
+                for i in range(0, len(rows), INSERT_ROWS_PER_STATEMENT):
+                    chunk = rows[i:i + INSERT_ROWS_PER_STATEMENT]
+                    cursor = conn.execute(
+                        _build_jobs_insert_query(len(chunk)),
+                        list(itertools.chain.from_iterable(chunk))
+                    )
+                    # rowcount counts rows actually inserted; ignored duplicates are excluded
+                    inserted_count += cursor.rowcount
+        return inserted_count
+    
     def get_jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
         """Retrieve jobs from database with optional filtering."""
         query = "SELECT * FROM jobs"
@@ -169,7 +349,7 @@ class DatabaseManager:
             query += " LIMIT ?"
             params.append(limit)
         
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute(query, params)
             jobs = []
             for row in cursor.fetchall():
@@ -181,7 +361,7 @@ class DatabaseManager:
     def update_job_status(self, job_id: int, status: str, ai_score: Optional[float] = None, 
                          ai_reasoning: Optional[str] = None) -> None:
         """Update job status and AI filtering results."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             conn.execute("""
                 UPDATE jobs 
                 SET status = ?, ai_score = ?, ai_reasoning = ?
@@ -191,7 +371,7 @@ class DatabaseManager:
     # Application operations
     def create_application(self, job_id: int) -> int:
         """Create a new application for a job."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 INSERT INTO applications (job_id)
                 VALUES (?)
@@ -209,7 +389,7 @@ class DatabaseManager:
         fields = ', '.join([f"{k} = ?" for k in kwargs.keys()])
         values = list(kwargs.values()) + [app_id]
         
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             conn.execute(f"""
                 UPDATE applications 
                 SET {fields}
@@ -231,14 +411,14 @@ class DatabaseManager:
         
         query += " ORDER BY a.updated_at DESC"
         
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
     
     # Contact operations
     def insert_contact(self, contact_data: Dict[str, Any]) -> int:
         """Insert contact information."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 INSERT INTO contacts 
                 (job_id, company, name, email, title, linkedin_url, phone, 
@@ -260,7 +440,7 @@ class DatabaseManager:
     
     def get_contacts_for_job(self, job_id: int) -> List[Dict]:
         """Get all contacts for a specific job."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 SELECT * FROM contacts 
                 WHERE job_id = ? 
@@ -271,7 +451,7 @@ class DatabaseManager:
     # Batch run operations
     def create_batch_run(self, name: str, source_urls: List[str]) -> int:
         """Create a new batch processing run."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 INSERT INTO batch_runs (name, source_urls)
                 VALUES (?, ?)
@@ -286,7 +466,7 @@ class DatabaseManager:
         fields = ', '.join([f"{k} = ?" for k in kwargs.keys()])
         values = list(kwargs.values()) + [batch_id]
         
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             conn.execute(f"""
                 UPDATE batch_runs 
                 SET {fields}
@@ -295,7 +475,7 @@ class DatabaseManager:
     
     def get_batch_runs(self, limit: int = 10) -> List[Dict]:
         """Get recent batch runs."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("""
                 SELECT * FROM batch_runs 
                 ORDER BY started_at DESC 
@@ -311,7 +491,7 @@ class DatabaseManager:
     # Settings operations
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             cursor = conn.execute("SELECT value FROM settings WHERE key = ?", (key,))
             row = cursor.fetchone()
             if row:
@@ -323,17 +503,42 @@ class DatabaseManager:
     
     def set_setting(self, key: str, value: Any) -> None:
         """Set a setting value."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             json_value = json.dumps(value) if not isinstance(value, str) else value
             conn.execute("""
                 INSERT OR REPLACE INTO settings (key, value, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
             """, (key, json_value))
     
+    # Feed cache operations
+    def get_feed_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached HTTP validators and parsed entries for a feed URL."""
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "SELECT etag, last_modified, entries FROM feed_cache WHERE url = ?", (url,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return {
+                    'etag': row['etag'],
+                    'last_modified': row['last_modified'],
+                    'entries': json.loads(row['entries'])
+                }
+            return None
+    
+    def set_feed_cache(self, url: str, etag: Optional[str], last_modified: Optional[str],
+                       entries: List[Dict[str, Any]]) -> None:
+        """Store HTTP validators and parsed entries for a feed URL."""
+        with self.connection() as conn, conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, entries, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (url, etag, last_modified, json.dumps(entries)))
+    
     # Analytics and reporting
     def get_stats(self) -> Dict[str, Any]:
         """Get application statistics."""
-        with self.get_connection() as conn:
+        with self.connection() as conn, conn:
             stats = {}
             
             # Job stats
@@ -359,18 +564,25 @@ class DatabaseManager:
             
             return stats
     
-    def get_recent_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent jobs for dashboard activity feed."""
+    def get_recent_jobs(self, limit: int = 10, preview_chars: int = 200) -> List[Dict[str, Any]]:
+        """
+        Get recent jobs for dashboard activity feed.
+        
+        description_preview holds up to preview_chars + 1 characters, so callers
+        can tell whether the description was cut off.
+        """
         try:
-            with self.get_connection() as conn:
+            with self.connection() as conn, conn:
                 cursor = conn.cursor()
                 
+                # Only the start of each description is needed for the preview
                 cursor.execute("""
-                    SELECT id, title, company, location, status, scraped_at, ai_score
+                    SELECT id, title, company, location, status, scraped_at, ai_score,
+                           substr(description, 1, ?) AS description_preview
                     FROM jobs 
                     ORDER BY scraped_at DESC 
                     LIMIT ?
-                """, (limit,))
+                """, (preview_chars + 1, limit))
                 
                 columns = [desc[0] for desc in cursor.description]
                 return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -379,37 +591,52 @@ class DatabaseManager:
             logger.error(f"Error getting recent jobs: {e}")
             return []
     
-    def get_jobs_filtered(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Get jobs with applied filters."""
+    def _job_filter_clause(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """
+        Build the WHERE clause and parameters shared by the filtered job queries.
+        
+        Recognised keys are status, company, location, search and min_score. search
+        is the dashboard search box: a substring match on title, company or description.
+        """
+        where = "1=1"
+        params = []
+        
+        if filters.get('status'):
+            where += " AND status = ?"
+            params.append(filters['status'])
+        
+        if filters.get('company'):
+            where += " AND company LIKE ?"
+            params.append(f"%{filters['company']}%")
+        
+        if filters.get('location'):
+            where += " AND location LIKE ?"
+            params.append(f"%{filters['location']}%")
+        
+        if filters.get('search'):
+            where += " AND (title LIKE ? OR company LIKE ? OR description LIKE ?)"
+            params.extend([f"%{filters['search']}%"] * 3)
+        
+        if filters.get('min_score'):
+            where += " AND ai_score >= ?"
+            params.append(filters['min_score'])
+        
+        return where, params
+    
+    def get_jobs_filtered(self, filters: Dict[str, Any], limit: Optional[int] = None,
+                          offset: int = 0) -> List[Dict[str, Any]]:
+        """Get one page of jobs with applied filters (all matches when no limit is given)."""
         try:
-            with self.get_connection() as conn:
+            with self.connection() as conn, conn:
                 cursor = conn.cursor()
                 
-                query = "SELECT * FROM jobs WHERE 1=1"
-                params = []
-                
-                # Apply filters
-                if filters.get('status'):
-                    query += " AND status = ?"
-                    params.append(filters['status'])
+                where, params = self._job_filter_clause(filters)
+                query = f"SELECT * FROM jobs WHERE {where} ORDER BY scraped_at DESC"
                 
-                if filters.get('company'):
-                    query += " AND company LIKE ?"
-                    params.append(f"%{filters['company']}%")
-                
-                if filters.get('location'):
-                    query += " AND location LIKE ?"
-                    params.append(f"%{filters['location']}%")
-                
-                if filters.get('min_score'):
-                    query += " AND ai_score >= ?"
-                    params.append(filters['min_score'])
-                
-                query += " ORDER BY scraped_at DESC"
-                
-                if filters.get('limit'):
-                    query += " LIMIT ?"
-                    params.append(filters['limit'])
+                limit = limit or filters.get('limit')
+                if limit:
+                    query += " LIMIT ? OFFSET ?"
+                    params.extend([limit, offset])
                 
                 cursor.execute(query, params)
                 columns = [desc[0] for desc in cursor.description]
@@ -417,4 +644,16 @@ class DatabaseManager:
                 
         except Exception as e:
             logger.error(f"Error getting filtered jobs: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def count_jobs_filtered(self, filters: Dict[str, Any]) -> int:
+        """Count the jobs matching the filters."""
+        try:
+            with self.connection() as conn, conn:
+                where, params = self._job_filter_clause(filters)
+                cursor = conn.execute(f"SELECT COUNT(*) FROM jobs WHERE {where}", params)
+                return cursor.fetchone()[0]
+                
+        except Exception as e:
+            logger.error(f"Error counting filtered jobs: {e}")
+            return 0
\ No newline at end of file
@@ -6,7 +6,9 @@ and application settings with secure API key management.
 """
 
 import os
-from typing import Dict, Any, Optional, List
+import stat
+import tempfile
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 import logging
@@ -25,6 +27,8 @@ class LLMConfig:
     default_model: str = "anthropic/claude-3.5-sonnet"
     temperature: float = 0.7
     max_tokens: int = 4000
+    openrouter_concurrency: int = 5
+    ollama_concurrency: int = 2
 
 @dataclass
 class ContactFinderConfig:
@@ -64,6 +68,10 @@ class ScrapingConfig:
     user_agent: str = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    use_proxy: bool = False
+    headless: bool = True
+    respect_robots: bool = True
+    cache_responses: bool = True
 
 @dataclass
 class AppConfig:
@@ -113,6 +121,8 @@ class ConfigManager:
         self.config.llm.local_llm_model = os.getenv("LOCAL_LLM_MODEL", "qwen2.5:32b")
         self.config.llm.ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.config.llm.default_model = os.getenv("DEFAULT_LLM_MODEL", "anthropic/claude-3.5-sonnet")
+        self.config.llm.openrouter_concurrency = int(os.getenv("OPENROUTER_CONCURRENCY", "5"))
+        self.config.llm.ollama_concurrency = int(os.getenv("OLLAMA_NUM_PARALLEL", "2"))
         
         # Contact Finder Configuration
         self.config.contact_finder.hunter_io_api_key = os.getenv("HUNTER_IO_API_KEY")
@@ -204,9 +214,9 @@ class ConfigManager:
         
         return issues
     
-    def mask_sensitive_config(self) -> Dict[str, Any]:
-        """Get configuration with sensitive values masked for display."""
-        config_dict = asdict(self.config)
+    def mask_sensitive_config(self, config: Optional[AppConfig] = None) -> Dict[str, Any]:
+        """Get configuration (the manager's own by default) with sensitive values masked for display."""
+        config_dict = asdict(config or self.config)
         
         # Mask API keys
         sensitive_keys = [
@@ -252,34 +262,53 @@ class ConfigManager:
     
     def update_config(self, **kwargs) -> None:
         """Update configuration values dynamically."""
-        for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
-            else:
+        self.update_many(kwargs.items())
+    
+    def update_many(self, pairs: Iterable[Tuple[str, Any]], config: Optional[AppConfig] = None) -> List[str]:
+        """
+        Update configuration values from (key, value) pairs; keys may be 'section.setting'.
+        
+        Updates the manager's own configuration unless another config object is given.
+        Returns the keys whose value actually changed.
+        """
+        config = config or self.config
+        changed_keys = []
+        for key, value in pairs:
+            target, setting = config, key
+            if not hasattr(config, key):
                 # Handle nested config updates
                 parts = key.split('.')
-                if len(parts) == 2:
-                    section, setting = parts
-                    if hasattr(self.config, section):
-                        section_obj = getattr(self.config, section)
-                        if hasattr(section_obj, setting):
-                            setattr(section_obj, setting, value)
+                if len(parts) != 2 or not hasattr(config, parts[0]):
+                    continue
+                target, setting = getattr(config, parts[0]), parts[1]
+                if not hasattr(target, setting):
+                    continue
+            
+            if getattr(target, setting) != value:
+                setattr(target, setting, value)
+                changed_keys.append(key)
         
-        logger.info(f"Configuration updated: {list(kwargs.keys())}")
+        logger.info(f"Configuration updated: {changed_keys}")
+        return changed_keys
     
-    def save_to_env_file(self) -> None:
-        """Save current configuration to .env file."""
+    def save_to_env_file(self) -> bool:
+        """
+        Save current configuration to .env file.
+        
+        The file is written atomically (fsynced temp file + os.replace) and left
+        untouched when its content would not change. Returns whether it was written.
+        """
         env_file_path = Path(self.env_file)
         
         # Read existing .env file if it exists
         existing_vars = {}
-        if env_file_path.exists():
-            with open(env_file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        existing_vars[key] = value
+        existing_content = env_file_path.read_text() if env_file_path.exists() else None
+        if existing_content is not None:
+            for line in existing_content.splitlines():
+                line = line.strip()
+                if line and not line.startswith('#') and '=' in line:
+                    key, value = line.split('=', 1)
+                    existing_vars[key] = value
         
         # Update with current configuration
         env_vars = {
@@ -307,46 +336,69 @@ class ConfigManager:
         # Merge with existing variables (preserve comments and other vars)
         existing_vars.update(env_vars)
         
+        # Render the whole file first so an unchanged configuration skips the write
+        content = "".join([
+            "# AI Job Application Preparation Tool Configuration\n",
+            "# This file is automatically generated by the UI\n\n",
+            
+            "# LLM Configuration\n",
+            f"OPENROUTER_API_KEY={existing_vars.get('OPENROUTER_API_KEY', '')}\n",
+            f"USE_LOCAL_LLM={existing_vars.get('USE_LOCAL_LLM', 'false')}\n",
+            f"LOCAL_LLM_MODEL={existing_vars.get('LOCAL_LLM_MODEL', 'qwen2.5:32b')}\n",
+            f"OLLAMA_BASE_URL={existing_vars.get('OLLAMA_BASE_URL', 'http://localhost:11434')}\n",
+            f"DEFAULT_LLM_MODEL={existing_vars.get('DEFAULT_LLM_MODEL', 'anthropic/claude-3.5-sonnet')}\n\n",
+            
+            "# Contact Finder APIs\n",
+            f"HUNTER_IO_API_KEY={existing_vars.get('HUNTER_IO_API_KEY', '')}\n",
+            f"APOLLO_IO_API_KEY={existing_vars.get('APOLLO_IO_API_KEY', '')}\n\n",
+            
+            "# User Information\n",
+            f"USER_NAME={existing_vars.get('USER_NAME', 'Your Full Name')}\n",
+            f"USER_EMAIL={existing_vars.get('USER_EMAIL', 'your.email@example.com')}\n",
+            f"USER_PHONE={existing_vars.get('USER_PHONE', '+1-555-123-4567')}\n",
+            f"USER_LOCATION={existing_vars.get('USER_LOCATION', 'San Francisco, CA')}\n",
+            f"USER_LINKEDIN_URL={existing_vars.get('USER_LINKEDIN_URL', '')}\n",
+            f"USER_GITHUB_URL={existing_vars.get('USER_GITHUB_URL', '')}\n\n",
+            
+            "# Application Settings\n",
+            f"MAX_JOBS_PER_BATCH={existing_vars.get('MAX_JOBS_PER_BATCH', '50')}\n",
+            f"SCRAPING_DELAY_SECONDS={existing_vars.get('SCRAPING_DELAY_SECONDS', '2.0')}\n",
+            f"RATE_LIMIT_REQUESTS_PER_MINUTE={existing_vars.get('RATE_LIMIT_REQUESTS_PER_MINUTE', '30')}\n\n",
+            
+            "# Logging\n",
+            f"LOG_LEVEL={existing_vars.get('LOG_LEVEL', 'INFO')}\n",
+            f"LOG_TO_FILE={existing_vars.get('LOG_TO_FILE', 'true')}\n\n",
+            
+            "# Security\n",
+            f"SECRET_KEY={existing_vars.get('SECRET_KEY', 'your_secret_key_for_streamlit_auth')}\n"
+        ])
+        
+        if content == existing_content:
+            logger.debug(f"Configuration unchanged; {env_file_path} not rewritten")
+            return False
+        
         # Write to .env file
+        temp_path = None
         try:
-            with open(env_file_path, 'w') as f:
-                f.write("# AI Job Application Preparation Tool Configuration\n")
-                f.write("# This file is automatically generated by the UI\n\n")
-                
-                f.write("# LLM Configuration\n")
-                f.write(f"OPENROUTER_API_KEY={existing_vars.get('OPENROUTER_API_KEY', '')}\n")
-                f.write(f"USE_LOCAL_LLM={existing_vars.get('USE_LOCAL_LLM', 'false')}\n")
-                f.write(f"LOCAL_LLM_MODEL={existing_vars.get('LOCAL_LLM_MODEL', 'qwen2.5:32b')}\n")
-                f.write(f"OLLAMA_BASE_URL={existing_vars.get('OLLAMA_BASE_URL', 'http://localhost:11434')}\n")
-                f.write(f"DEFAULT_LLM_MODEL={existing_vars.get('DEFAULT_LLM_MODEL', 'anthropic/claude-3.5-sonnet')}\n\n")
-                
-                f.write("# Contact Finder APIs\n")
-                f.write(f"HUNTER_IO_API_KEY={existing_vars.get('HUNTER_IO_API_KEY', '')}\n")
-                f.write(f"APOLLO_IO_API_KEY={existing_vars.get('APOLLO_IO_API_KEY', '')}\n\n")
-                
-                f.write("# User Information\n")
-                f.write(f"USER_NAME={existing_vars.get('USER_NAME', 'Your Full Name')}\n")
-                f.write(f"USER_EMAIL={existing_vars.get('USER_EMAIL', 'your.email@example.com')}\n")
-                f.write(f"USER_PHONE={existing_vars.get('USER_PHONE', '+1-555-123-4567')}\n")
-                f.write(f"USER_LOCATION={existing_vars.get('USER_LOCATION', 'San Francisco, CA')}\n")
-                f.write(f"USER_LINKEDIN_URL={existing_vars.get('USER_LINKEDIN_URL', '')}\n")
-                f.write(f"USER_GITHUB_URL={existing_vars.get('USER_GITHUB_URL', '')}\n\n")
-                
-                f.write("# Application Settings\n")
-                f.write(f"MAX_JOBS_PER_BATCH={existing_vars.get('MAX_JOBS_PER_BATCH', '50')}\n")
-                f.write(f"SCRAPING_DELAY_SECONDS={existing_vars.get('SCRAPING_DELAY_SECONDS', '2.0')}\n")
-                f.write(f"RATE_LIMIT_REQUESTS_PER_MINUTE={existing_vars.get('RATE_LIMIT_REQUESTS_PER_MINUTE', '30')}\n\n")
-                
-                f.write("# Logging\n")
-                f.write(f"LOG_LEVEL={existing_vars.get('LOG_LEVEL', 'INFO')}\n")
-                f.write(f"LOG_TO_FILE={existing_vars.get('LOG_TO_FILE', 'true')}\n\n")
-                
-                f.write("# Security\n")
-                f.write(f"SECRET_KEY={existing_vars.get('SECRET_KEY', 'your_secret_key_for_streamlit_auth')}\n")
+            # Write a fsynced sibling temp file and swap it in, so readers never see a partial .env
+            with tempfile.NamedTemporaryFile('w', dir=env_file_path.resolve().parent,
+                                             prefix=f"{env_file_path.name}.", suffix='.tmp',
+                                             delete=False) as f:
+                temp_path = Path(f.name)
+                if existing_content is not None:
+                    # Temp files are created 0600; keep the permissions of the .env being replaced
+                    os.chmod(f.name, stat.S_IMODE(env_file_path.stat().st_mode))
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(f.name, env_file_path)
             
             logger.info(f"Configuration saved to {env_file_path}")
+            return True
             
         except Exception as e:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
             logger.error(f"Failed to save configuration to .env file: {e}")
             raise
 
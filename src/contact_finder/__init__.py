@@ -494,7 +494,7 @@ class ContactFinder:
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def _cache_contacts(self, result: ContactSearchResult) -> None:
         """Cache contact search results."""
@@ -529,7 +529,7 @@ class ContactFinder:
             logger.error(f"Error caching contacts: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def find_contacts_for_jobs(self, job_ids: List[int]) -> Dict[int, ContactSearchResult]:
         """Find contacts for multiple jobs in batch."""
@@ -639,7 +639,7 @@ class ContactFinder:
             return {job_id: None for job_id in job_ids}
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
 
 async def find_contacts_for_company(company_name: str, domain: Optional[str] = None, db_manager: Optional[DatabaseManager] = None) -> ContactSearchResult:
     """
@@ -745,7 +745,7 @@ class DocumentManager:
             logger.error(f"Error saving document package: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def get_documents_for_job(self, job_id: int) -> Optional[DocumentPackage]:
         """Get generated documents for a specific job."""
@@ -802,7 +802,7 @@ class DocumentManager:
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def batch_generate_documents(self, requests: List[DocumentGenerationRequest]) -> Dict[int, Optional[DocumentPackage]]:
         """Generate documents for multiple jobs in batch."""
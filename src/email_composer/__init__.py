@@ -154,12 +154,13 @@ class EmailGenerator:
         self.template_manager = EmailTemplateManager()
         self.user_config = get_user_config()
     
-    async def generate_email(self, request: EmailGenerationRequest) -> Optional[GeneratedEmail]:
+    async def generate_email(self, request: EmailGenerationRequest, save: bool = True) -> Optional[GeneratedEmail]:
         """
         Generate a personalized email for a job application.
         
         Args:
             request: Email generation request with job and contact details
+            save: Whether to store the email as a new generated_emails row
             
         Returns:
             GeneratedEmail or None if generation failed
@@ -200,7 +201,8 @@ class EmailGenerator:
             )
             
             # Save to database
-            await self._save_generated_email(generated_email)
+            if save:
+                await self._save_generated_email(generated_email)
             
             logger.info(f"Generated email for job {request.job_id} to {request.contact.email}")
             return generated_email
@@ -439,23 +441,7 @@ Return only the subject line, no explanation.
             conn = self.db_manager.get_connection()
             cursor = conn.cursor()
             
-            # Create table if it doesn't exist
-            cursor.execute("""
-            CREATE TABLE IF NOT EXISTS generated_emails (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL,
-                contact_email TEXT NOT NULL,
-                contact_name TEXT,
-                subject TEXT NOT NULL,
-                body TEXT NOT NULL,
-                template_used TEXT,
-                personalization_score REAL,
-                generation_notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs (id)
-            )
-            """)
-            
+            # generated_emails is created by DatabaseManager.init_database
             # Insert generated email
             cursor.execute("""
             INSERT INTO generated_emails (
@@ -480,24 +466,42 @@ Return only the subject line, no explanation.
             logger.error(f"Error saving generated email: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
+    
+    async def generate_many(self, requests: List[EmailGenerationRequest], save: bool = True) -> List[Optional[GeneratedEmail]]:
+        """
+        Generate emails for several requests concurrently.
+        
+        Every LLM call goes through llm_manager, which holds the provider's
+        semaphore (OPENROUTER_CONCURRENCY / OLLAMA_NUM_PARALLEL) for its duration,
+        so the configured provider concurrency throttles the batch.
+        
+        Args:
+            requests: Email generation requests
+            save: Whether to store each email as a new generated_emails row
+            
+        Returns:
+            Generated emails in request order, None where generation failed
+        """
+        results = await asyncio.gather(
+            *(self.generate_email(request, save=save) for request in requests),
+            return_exceptions=True
+        )
+        
+        emails = []
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error generating email for job {request.job_id}: {result}")
+                result = None
+            emails.append(result)
+        
+        return emails
     
     async def batch_generate_emails(self, requests: List[EmailGenerationRequest]) -> Dict[int, Optional[GeneratedEmail]]:
         """Generate emails for multiple job applications in batch."""
-        results = {}
-        
         try:
-            # Process requests with some delay to respect rate limits
-            for i, request in enumerate(requests):
-                if i > 0:
-                    await asyncio.sleep(1)  # Rate limiting delay
-                
-                try:
-                    result = await self.generate_email(request)
-                    results[request.job_id] = result
-                except Exception as e:
-                    logger.error(f"Error generating email for job {request.job_id}: {e}")
-                    results[request.job_id] = None
+            emails = await self.generate_many(requests)
+            results = {request.job_id: email for request, email in zip(requests, emails)}
             
             logger.info(f"Completed batch email generation for {len(requests)} jobs")
             return results
@@ -544,7 +548,7 @@ Return only the subject line, no explanation.
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
 
 async def generate_email_for_job(
     job_id: int,
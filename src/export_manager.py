@@ -5,10 +5,13 @@ This module provides comprehensive export functionality for job application pack
 including emails, resumes, contact lists, and application tracking data.
 """
 
+import asyncio
 import os
 import json
 import csv
 import zipfile
+import sqlite3
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -25,6 +28,12 @@ from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Buffer size used when streaming files into ZIP archives
+ZIP_COPY_BUFFER_SIZE = 1 << 20
+
+# Approved job IDs per database, keyed by (MAX(processed_at), COUNT(*)) of accepted results
+_approved_job_ids_cache: Dict[str, Tuple[Tuple[Any, int], List[int]]] = {}
+
 @dataclass
 class ExportPackage:
     """Complete export package for job applications."""
@@ -58,6 +67,42 @@ class ApplicationExporter:
         # Setup export directory
         self.export_base_dir = Path(self.config.export_dir)
         self.export_base_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Connection shared by all reads within one export session
+        self._export_conn: Optional[sqlite3.Connection] = None
+    
+    def _get_export_connection(self) -> sqlite3.Connection:
+        """
+        Get the connection used for the current export session.
+        
+        The export path is read-heavy, so the connection is tuned for bulk
+        reads. WAL mode is persisted in the database file and only switched
+        on when not already active; the remaining pragmas are per-connection.
+        """
+        if self._export_conn is None:
+            conn = self.db_manager.get_connection()
+            
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                conn.execute("PRAGMA journal_mode=WAL")
+            
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-200000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            
+            self._export_conn = conn
+        
+        return self._export_conn
+    
+    def _close_export_connection(self) -> None:
+        """Return the export session connection to the pool if one is open."""
+        if self._export_conn is not None:
+            # Drop the bulk-read cache and memory map so pooled reuse stays small
+            self._export_conn.execute("PRAGMA mmap_size=0")
+            self._export_conn.execute("PRAGMA cache_size=-2000")
+            self.db_manager.release_connection(self._export_conn)
+            self._export_conn = None
     
     async def export_job_applications(self, request: ExportRequest) -> Dict[str, Any]:
         """
@@ -114,13 +159,15 @@ class ApplicationExporter:
             logger.error(f"Critical error during export: {e}")
             results["errors"].append(f"Critical error: {str(e)}")
             return results
+        finally:
+            self._close_export_connection()
     
     async def _get_job_application_data(self, job_ids: List[int]) -> Dict[int, Dict[str, Any]]:
         """Get comprehensive job application data for export."""
         job_data = {}
         
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             # Get basic job information
@@ -154,9 +201,6 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting job application data: {e}")
             return {}
-        finally:
-            if conn:
-                conn.close()
     
     async def _export_in_format(
         self, 
@@ -192,43 +236,25 @@ class ApplicationExporter:
         exported_files = []
         successful_count = 0
         
-        for job_id, data in job_data.items():
-            try:
-                job_info = data['job_info']
-                company_name = self._sanitize_filename(job_info['company'])
-                job_title = self._sanitize_filename(job_info['title'])
-                
-                # Create job-specific directory
-                job_dir = individual_dir / f"{company_name}_{job_title}_{job_id}"
-                job_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Export emails
-                if request.include_emails and data['emails']:
-                    emails_file = await self._export_job_emails(data['emails'], job_dir)
-                    if emails_file:
-                        exported_files.append(str(emails_file))
-                
-                # Export contacts
-                if request.include_contacts and data['contacts']:
-                    contacts_file = await self._export_job_contacts(data['contacts'], job_dir)
-                    if contacts_file:
-                        exported_files.append(str(contacts_file))
-                
-                # Copy resume documents
-                if request.include_resumes and data['documents']:
-                    doc_files = await self._copy_job_documents(data['documents'], job_dir)
-                    exported_files.extend(doc_files)
-                
-                # Create job summary
-                if request.include_metadata:
-                    summary_file = await self._create_job_summary(data, job_dir)
-                    if summary_file:
-                        exported_files.append(str(summary_file))
-                
-                successful_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error exporting individual package for job {job_id}: {e}")
+        # Each job writes to its own directory, so packages are written by worker
+        # threads; bound the number in flight to limit open file handles
+        semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+        
+        async def export_one(job_id: int, data: Dict[str, Any]) -> List[Path]:
+            async with semaphore:
+                return await asyncio.to_thread(self._write_job_package, job_id, data, individual_dir, request)
+        
+        job_ids = list(job_data.keys())
+        tasks = [export_one(job_id, job_data[job_id]) for job_id in job_ids]
+        completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Merge per-job results
+        for job_id, task_result in zip(job_ids, completed_tasks):
+            if isinstance(task_result, Exception):
+                logger.error(f"Error exporting individual package for job {job_id}: {task_result}")
+                continue
+            exported_files.extend(task_result)
+            successful_count += 1
         
         return {
             "files": exported_files,
@@ -236,6 +262,49 @@ class ApplicationExporter:
             "type": "individual_packages"
         }
     
+    def _write_job_package(self, job_id: int, data: Dict[str, Any], individual_dir: Path,
+                           request: ExportRequest) -> List[Path]:
+        """Write one job's application files to its own directory (blocking file I/O)."""
+        job_files = []
+        job_info = data['job_info']
+        company_name = self._sanitize_filename(job_info['company'])
+        job_title = self._sanitize_filename(job_info['title'])
+        
+        # Create job-specific directory
+        job_dir = individual_dir / f"{company_name}_{job_title}_{job_id}"
+        job_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Export emails
+        if request.include_emails and data['emails']:
+            emails_file = job_dir / "emails.txt"
+            emails_file.write_text(
+                "\n\n".join(self._format_email_for_client(email, job_info) for email in data['emails']),
+                encoding='utf-8'
+            )
+            job_files.append(emails_file)
+        
+        # Export contacts
+        if request.include_contacts and data['contacts']:
+            contacts_file = job_dir / "contacts.txt"
+            contacts_file.write_text(self._format_contacts_for_export(data['contacts']), encoding='utf-8')
+            job_files.append(contacts_file)
+        
+        # Copy resume documents
+        if request.include_resumes and data['documents']:
+            resumes_dir = job_dir / "resumes"
+            resumes_dir.mkdir(exist_ok=True)
+            for doc in data['documents']['documents']:
+                if os.path.exists(doc['file_path']):
+                    job_files.append(Path(shutil.copy2(doc['file_path'], resumes_dir / doc['filename'])))
+        
+        # Create job summary
+        if request.include_metadata:
+            summary_file = job_dir / "APPLICATION_SUMMARY.txt"
+            summary_file.write_text(self._create_application_summary(data), encoding='utf-8')
+            job_files.append(summary_file)
+        
+        return job_files
+    
     async def _export_bulk_csv(
         self, 
         job_data: Dict[int, Dict[str, Any]], 
@@ -262,38 +331,21 @@ class ApplicationExporter:
             ])
             
             # Data rows
-            for job_id, data in job_data.items():
-                job_info = data['job_info']
-                filter_result = data.get('filter_result', {})
-                customization = data.get('customization', {})
-                
-                writer.writerow([
-                    job_id,
-                    job_info.get('title', ''),
-                    job_info.get('company', ''),
-                    job_info.get('location', ''),
-                    job_info.get('posted_date', ''),
-                    job_info.get('salary_range', ''),
-                    job_info.get('employment_type', ''),
-                    job_info.get('experience_level', ''),
-                    job_info.get('url', ''),
-                    filter_result.get('decision', ''),
-                    customization.get('confidence_score', '')
-                ])
-        
-        exported_files.append(str(jobs_file))
+            writer.writerows(map(self._job_csv_row, job_data.items()))
+        
+        exported_files.append(jobs_file)
         
         # Export emails CSV
         if request.include_emails:
             emails_file = csv_dir / "emails.csv"
             await self._export_all_emails_csv(job_data, emails_file)
-            exported_files.append(str(emails_file))
+            exported_files.append(emails_file)
         
         # Export contacts CSV
         if request.include_contacts:
             contacts_file = csv_dir / "contacts.csv"
             await self._export_all_contacts_csv(job_data, contacts_file)
-            exported_files.append(str(contacts_file))
+            exported_files.append(contacts_file)
         
         return {
             "files": exported_files,
@@ -301,6 +353,28 @@ class ApplicationExporter:
             "type": "bulk_csv"
         }
     
+    @staticmethod
+    def _job_csv_row(item: Tuple[int, Dict[str, Any]]) -> Tuple[Any, ...]:
+        """Build a jobs.csv row from a (job_id, job data) pair."""
+        job_id, data = item
+        job_info = data['job_info']
+        filter_result = data.get('filter_result') or {}
+        customization = data.get('customization') or {}
+        
+        return (
+            job_id,
+            job_info.get('title', ''),
+            job_info.get('company', ''),
+            job_info.get('location', ''),
+            job_info.get('posted_date', ''),
+            job_info.get('salary_range', ''),
+            job_info.get('employment_type', ''),
+            job_info.get('experience_level', ''),
+            job_info.get('url', ''),
+            filter_result.get('decision', ''),
+            customization.get('confidence_score', '')
+        )
+    
     async def _export_email_client_format(
         self, 
         job_data: Dict[int, Dict[str, Any]], 
@@ -333,7 +407,7 @@ class ApplicationExporter:
                 with open(email_file, 'w', encoding='utf-8') as f:
                     f.write(email_content)
                 
-                exported_files.append(str(email_file))
+                exported_files.append(email_file)
                 email_count += 1
         
         # Create email summary with instructions
@@ -341,7 +415,7 @@ class ApplicationExporter:
         with open(instructions_file, 'w', encoding='utf-8') as f:
             f.write(self._create_email_client_instructions())
         
-        exported_files.append(str(instructions_file))
+        exported_files.append(instructions_file)
         
         return {
             "files": exported_files,
@@ -373,7 +447,7 @@ class ApplicationExporter:
                 zip_filename = f"{company_name}_{job_title}_application_package.zip"
                 zip_path = packages_dir / zip_filename
                 
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
                     # Add emails
                     if request.include_emails and data['emails']:
                         for i, email in enumerate(data['emails']):
@@ -384,7 +458,11 @@ class ApplicationExporter:
                     if request.include_resumes and data['documents']:
                         for doc in data['documents']['documents']:
                             if os.path.exists(doc['file_path']):
-                                zipf.write(doc['file_path'], f"resumes/{doc['filename']}")
+                                # Stream the file into the archive in 1MB chunks
+                                zinfo = zipfile.ZipInfo.from_file(doc['file_path'], f"resumes/{doc['filename']}")
+                                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                                with open(doc['file_path'], 'rb') as src, zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                                    shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER_SIZE)
                     
                     # Add contacts
                     if request.include_contacts and data['contacts']:
@@ -396,7 +474,7 @@ class ApplicationExporter:
                         summary_content = self._create_application_summary(data)
                         zipf.writestr("APPLICATION_SUMMARY.txt", summary_content)
                 
-                exported_files.append(str(zip_path))
+                exported_files.append(zip_path)
                 successful_count += 1
                 
             except Exception as e:
@@ -411,7 +489,7 @@ class ApplicationExporter:
     async def _get_emails_for_job(self, job_id: int) -> List[Dict[str, Any]]:
         """Get emails for a specific job."""
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -427,14 +505,11 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting emails for job {job_id}: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
     
     async def _get_contacts_for_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get contacts for a specific job."""
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -457,14 +532,11 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting contacts for job {job_id}: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     async def _get_documents_for_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get documents for a specific job."""
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             # Get document package
@@ -499,14 +571,11 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting documents for job {job_id}: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     async def _get_customization_for_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get customization result for a specific job."""
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -526,14 +595,11 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting customization for job {job_id}: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     async def _get_filter_result_for_job(self, job_id: int) -> Optional[Dict[str, Any]]:
         """Get filter result for a specific job."""
         try:
-            conn = self.db_manager.get_connection()
+            conn = self._get_export_connection()
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -553,9 +619,6 @@ class ApplicationExporter:
         except Exception as e:
             logger.error(f"Error getting filter result for job {job_id}: {e}")
             return None
-        finally:
-            if conn:
-                conn.close()
     
     def _sanitize_filename(self, text: str) -> str:
         """Sanitize text for use in filenames."""
@@ -758,7 +821,7 @@ Generated by AI Job Application Automation System
         ]
         
         for file_path in results['summary_files']:
-            relative_path = Path(file_path).relative_to(export_dir)
+            relative_path = file_path.relative_to(export_dir)
             summary_content.append(f"  - {relative_path}")
         
         if results['errors']:
@@ -779,7 +842,58 @@ Generated by AI Job Application Automation System
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("\n".join(summary_content))
         
-        results['summary_files'].append(str(summary_file))
+        results['summary_files'].append(summary_file)
+        
+        # Paths are kept as Path objects during export; expose them as strings
+        results['summary_files'] = [str(file_path) for file_path in results['summary_files']]
+
+def _get_approved_job_ids(db_manager: DatabaseManager) -> List[int]:
+    """
+    Get accepted job IDs, newest first, reusing the last result while unchanged.
+    
+    The cheap MAX/COUNT probe changes whenever a result is accepted, re-processed
+    or moved out of 'accept', so only then is the full DISTINCT query re-run.
+    
+    Args:
+        db_manager: Database manager instance
+        
+    Returns:
+        List of approved job IDs
+    """
+    conn = None
+    try:
+        conn = db_manager.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+        SELECT MAX(processed_at), COUNT(*)
+        FROM filter_results
+        WHERE decision = 'accept'
+        """)
+        version = tuple(cursor.fetchone())
+        
+        cache_key = str(db_manager.db_path)
+        cached = _approved_job_ids_cache.get(cache_key)
+        if cached and cached[0] == version:
+            return list(cached[1])
+        
+        cursor.execute("""
+        SELECT DISTINCT fr.job_id 
+        FROM filter_results fr
+        WHERE fr.decision = 'accept'
+        ORDER BY fr.processed_at DESC
+        """)
+        
+        job_ids = [row[0] for row in cursor.fetchall()]
+        _approved_job_ids_cache[cache_key] = (version, job_ids)
+        return list(job_ids)
+        
+    except Exception as e:
+        logger.error(f"Error getting approved jobs: {e}")
+        return []
+    finally:
+        if conn:
+            db_manager.release_connection(conn)
 
 async def export_approved_applications(
     job_ids: Optional[List[int]] = None,
@@ -806,25 +920,7 @@ async def export_approved_applications(
     
     # Get approved job IDs if not provided
     if job_ids is None:
-        try:
-            conn = db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-            SELECT DISTINCT fr.job_id 
-            FROM filter_results fr
-            WHERE fr.decision = 'accept'
-            ORDER BY fr.processed_at DESC
-            """)
-            
-            job_ids = [row[0] for row in cursor.fetchall()]
-            
-        except Exception as e:
-            logger.error(f"Error getting approved jobs: {e}")
-            job_ids = []
-        finally:
-            if conn:
-                conn.close()
+        job_ids = _get_approved_job_ids(db_manager)
     
     if not job_ids:
         return {
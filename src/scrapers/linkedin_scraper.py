@@ -5,12 +5,17 @@ This module provides functionality to scrape job postings from LinkedIn RSS feed
 It extracts job data and stores it in the database for further processing.
 """
 
-import feedparser
+import asyncio
 import requests
+from lxml import etree
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import List, Dict, Optional, Any, Iterator, Callable
 from urllib.parse import urlparse, parse_qs
+import itertools
 import re
+import threading
 import time
 import logging
 from dataclasses import dataclass
@@ -20,6 +25,60 @@ from ..utils.rate_limiter import RateLimitConfig, RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for RSS entry parsing
+TITLE_COMPANY_PATTERN = re.compile(r'\s+at\s+(.+?)(?:\s+in\s+(.+))?$', re.IGNORECASE)
+TITLE_SUFFIX_PATTERN = re.compile(r'\s+at\s+.+$', re.IGNORECASE)
+LOCATION_PATTERN = re.compile(r'Location[:\s]+([^,\n]+)', re.IGNORECASE)
+
+# Each category is a single alternation so the description is scanned once
+EMPLOYMENT_TYPE_PATTERN = re.compile(
+    r'Full[- ]?time|Part[- ]?time|Contract|Temporary|Internship|Freelance',
+    re.IGNORECASE
+)
+EXPERIENCE_LEVEL_PATTERN = re.compile(
+    r'Entry[- ]?level|Junior|Senior|Lead|Principal|Manager|Director',
+    re.IGNORECASE
+)
+# Dollar amounts take precedence; bare "120k per year" figures are only a fallback,
+# otherwise "5 years of experience" earlier in the text would win
+SALARY_DOLLAR_PATTERN = re.compile(
+    r'\$[\d,]+(?:\s*-\s*\$?[\d,]+)?(?:\s*(?:per\s+)?(?:year|annually|yr))?',
+    re.IGNORECASE
+)
+SALARY_NUMBER_PATTERN = re.compile(
+    r'[\d,]+k?(?:\s*-\s*[\d,]+k?)?\s*(?:per\s+)?(?:year|annually|yr)',
+    re.IGNORECASE
+)
+
+JOB_ID_VIEW_PATTERN = re.compile(r'/jobs/view/(\d+)')
+JOB_ID_PARAM_PATTERN = re.compile(r'currentJobId=(\d+)')
+
+
+@lru_cache(maxsize=4096)
+def _extract_job_id(url: str) -> Optional[str]:
+    """Extract the LinkedIn job ID from a job URL; feeds repeat URLs across polls."""
+    # LinkedIn job URLs typically contain the job ID
+    match = JOB_ID_VIEW_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    
+    # Alternative pattern for different URL formats
+    match = JOB_ID_PARAM_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    
+    return None
+
+class _TextExtractor(HTMLParser):
+    """Collects the text content of an HTML fragment, dropping tags and comments."""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks: List[str] = []
+    
+    def handle_data(self, data: str) -> None:
+        self.chunks.append(data)
+
 
 @dataclass
 class JobPosting:
@@ -67,8 +126,15 @@ class LinkedInRSScraper:
         
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Feed XML compresses well; keep the connection open across polls
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
+        
+        # Start time reserved for the next feed request; shared by scrape_many's worker threads
+        self._request_lock = threading.Lock()
+        self._next_fetch_at = 0.0
     
     def build_linkedin_rss_url(self, keywords: str, location: str = "", 
                               experience_level: str = "", job_type: str = "") -> str:
@@ -113,25 +179,19 @@ class LinkedInRSScraper:
             Job ID if found, None otherwise
         """
         try:
-            # LinkedIn job URLs typically contain the job ID
-            match = re.search(r'/jobs/view/(\d+)', url)
-            if match:
-                return match.group(1)
-            
-            # Alternative pattern for different URL formats
-            match = re.search(r'currentJobId=(\d+)', url)
-            if match:
-                return match.group(1)
-                
-            return None
+            return _extract_job_id(url)
         except Exception as e:
             logger.warning(f"Failed to extract job ID from URL {url}: {e}")
             return None
     
-    def clean_text(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def clean_text(text: str) -> str:
         """
         Clean and normalize text content.
         
+        Results are memoized, since feeds often repeat boilerplate descriptions.
+        
         Args:
             text: Raw text content
             
@@ -141,16 +201,13 @@ class LinkedInRSScraper:
         if not text:
             return ""
         
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Strip HTML tags and decode entities in a single parser pass
+        stripper = _TextExtractor()
+        stripper.feed(text)
+        stripper.close()
         
-        # Remove extra whitespace
-        text = text.strip()
-        
-        return text
+        # Normalize and trim whitespace
+        return ' '.join(''.join(stripper.chunks).split())
     
     def extract_job_details(self, entry: Dict[str, Any]) -> Optional[JobPosting]:
         """
@@ -173,7 +230,7 @@ class LinkedInRSScraper:
                 return None
             
             # Extract job ID
-            job_id = self.extract_job_id_from_url(link)
+            job_id = entry.get('job_id') or self.extract_job_id_from_url(link)
             
             # Parse published date
             published_date = datetime.now(timezone.utc)
@@ -183,70 +240,37 @@ class LinkedInRSScraper:
                 except Exception as e:
                     logger.warning(f"Failed to parse published date: {e}")
             
-            # Extract company and location from title or description
-            company = "Unknown"
-            location = "Unknown"
+            # Extract company and location from the entry, title or description
+            company = entry.get('company') or "Unknown"
+            location = entry.get('location') or "Unknown"
             
             # Try to extract company from title (common format: "Job Title at Company Name")
-            title_match = re.search(r'\s+at\s+(.+?)(?:\s+in\s+(.+))?$', title, re.IGNORECASE)
+            title_match = TITLE_COMPANY_PATTERN.search(title)
             if title_match:
                 company = title_match.group(1).strip()
                 if title_match.group(2):
                     location = title_match.group(2).strip()
                 # Clean title by removing the "at Company" part
-                title = re.sub(r'\s+at\s+.+$', '', title, flags=re.IGNORECASE).strip()
+                title = TITLE_SUFFIX_PATTERN.sub('', title).strip()
             
             # Try to extract location from description if not found in title
             if location == "Unknown":
-                location_match = re.search(r'Location[:\s]+([^,\n]+)', description, re.IGNORECASE)
+                location_match = LOCATION_PATTERN.search(description)
                 if location_match:
                     location = location_match.group(1).strip()
             
             # Extract employment type
-            employment_type = None
-            type_patterns = [
-                r'Full[- ]?time',
-                r'Part[- ]?time',
-                r'Contract',
-                r'Temporary',
-                r'Internship',
-                r'Freelance'
-            ]
-            
-            for pattern in type_patterns:
-                if re.search(pattern, description, re.IGNORECASE):
-                    employment_type = re.search(pattern, description, re.IGNORECASE).group(0)
-                    break
+            type_match = EMPLOYMENT_TYPE_PATTERN.search(description)
+            employment_type = type_match.group(0) if type_match else None
             
             # Extract experience level
-            experience_level = None
-            exp_patterns = [
-                r'Entry[- ]?level',
-                r'Junior',
-                r'Senior',
-                r'Lead',
-                r'Principal',
-                r'Manager',
-                r'Director'
-            ]
-            
-            for pattern in exp_patterns:
-                if re.search(pattern, description, re.IGNORECASE):
-                    experience_level = re.search(pattern, description, re.IGNORECASE).group(0)
-                    break
+            exp_match = EXPERIENCE_LEVEL_PATTERN.search(description)
+            experience_level = exp_match.group(0) if exp_match else None
             
             # Extract salary information
-            salary_range = None
-            salary_patterns = [
-                r'\$[\d,]+(?:\s*-\s*\$?[\d,]+)?(?:\s*(?:per\s+)?(?:year|annually|yr))?',
-                r'[\d,]+k?(?:\s*-\s*[\d,]+k?)?\s*(?:per\s+)?(?:year|annually|yr)',
-            ]
-            
-            for pattern in salary_patterns:
-                salary_match = re.search(pattern, description, re.IGNORECASE)
-                if salary_match:
-                    salary_range = salary_match.group(0)
-                    break
+            salary_match = (SALARY_DOLLAR_PATTERN.search(description)
+                            or SALARY_NUMBER_PATTERN.search(description))
+            salary_range = salary_match.group(0) if salary_match else None
             
             return JobPosting(
                 title=title,
@@ -266,58 +290,172 @@ class LinkedInRSScraper:
             logger.error(f"Failed to extract job details from RSS entry: {e}")
             return None
     
-    def fetch_rss_feed(self, rss_url: str) -> Optional[List[Dict[str, Any]]]:
+    def _parse_job_cards(self, source) -> Iterator[Dict[str, Any]]:
         """
-        Fetch and parse RSS feed from URL.
+        Incrementally parse job cards from a LinkedIn job search response.
+        
+        The guest search endpoint returns an HTML fragment of <li> job cards
+        rather than RSS, so cards are read with lxml's HTML parser.
+        
+        Args:
+            source: File-like object containing the HTML response
+            
+        Yields:
+            Feed entries with title, link, summary, company, location,
+            job_id and published_parsed keys
+        """
+        for _, card in etree.iterparse(source, tag='li', html=True, recover=True):
+            link = card.xpath("string(.//a[contains(@class, 'base-card__full-link')]/@href)")
+            if not link:
+                link = card.xpath("string(.//a/@href)")
+            
+            urn = card.xpath("string(.//*[@data-entity-urn]/@data-entity-urn)")
+            listed_date = card.xpath("string(.//time/@datetime)")
+            
+            published_parsed = None
+            if listed_date:
+                try:
+                    published_parsed = time.strptime(listed_date, '%Y-%m-%d')
+                except ValueError:
+                    pass
+            
+            entry = {
+                'title': card.xpath("string(.//h3)").strip(),
+                # Drop per-request tracking parameters so URLs stay stable across polls
+                'link': link.split('?', 1)[0].strip(),
+                'summary': ' '.join(card.itertext()),
+                'company': card.xpath("string(.//h4)").strip(),
+                'location': card.xpath("string(.//*[contains(@class, 'job-search-card__location')])").strip(),
+                'job_id': urn.rsplit(':', 1)[-1] if urn else None,
+                'published_parsed': published_parsed
+            }
+            
+            # Release parsed cards so memory stays flat for large responses
+            card.clear()
+            while card.getprevious() is not None:
+                del card.getparent()[0]
+            
+            yield entry
+    
+    def _get_cached_feed(self, rss_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load cached validators and entries for a feed URL.
         
         Args:
             rss_url: RSS feed URL
             
         Returns:
-            List of RSS entries if successful, None otherwise
+            Cached feed data if available, None otherwise
+        """
+        try:
+            return self.db_manager.get_feed_cache(rss_url)
+        except Exception as e:
+            logger.warning(f"Failed to read feed cache for {rss_url}: {e}")
+            return None
+    
+    def _store_cached_feed(self, rss_url: str, etag: Optional[str], last_modified: Optional[str],
+                           entries: List[Dict[str, Any]]) -> None:
+        """
+        Save validators and parsed entries for a feed URL.
+        
+        Args:
+            rss_url: RSS feed URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            entries: Parsed feed entries
         """
         try:
-            # Simple time-based rate limiting for synchronous usage
-            import time
-            current_time = time.time()
-            if hasattr(self, '_last_request_time'):
-                time_since_last = current_time - self._last_request_time
-                min_interval = 60.0 / self.rate_limiter.config.requests_per_minute
-                if time_since_last < min_interval:
-                    wait_time = min_interval - time_since_last
-                    logger.info(f"Rate limiting: waiting {wait_time:.1f}s")
-                    time.sleep(wait_time)
-            
-            self._last_request_time = time.time()
+            self.db_manager.set_feed_cache(rss_url, etag, last_modified, entries)
+        except Exception as e:
+            logger.warning(f"Failed to update feed cache for {rss_url}: {e}")
+    
+    def _wait_for_request_slot(self) -> None:
+        """
+        Space feed requests to respect the per-minute rate limit.
+        
+        Start times are reserved under a lock, so concurrent fetches from
+        worker threads are spaced out as well.
+        """
+        min_interval = 60.0 / self.rate_limiter.config.requests_per_minute
+        with self._request_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_fetch_at)
+            self._next_fetch_at = start_at + min_interval
+        
+        delay = start_at - now
+        if delay > 0:
+            logger.info(f"Rate limiting: waiting {delay:.1f}s")
+            time.sleep(delay)
+    
+    def fetch_rss_feed(self, rss_url: str) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch and parse RSS feed from URL.
+        
+        The response is streamed and parsed incrementally, so entries are
+        yielded as soon as each job card is complete.
+        
+        Args:
+            rss_url: RSS feed URL
+            
+        Yields:
+            Feed entries as produced by _parse_job_cards
+        """
+        response = None
+        try:
+            self._wait_for_request_slot()
             
             logger.info(f"Fetching RSS feed from: {rss_url}")
             
-            response = self.session.get(rss_url, timeout=30)
-            response.raise_for_status()
+            # Send conditional GET validators from the last complete fetch
+            cached_feed = self._get_cached_feed(rss_url)
+            headers = {}
+            if cached_feed:
+                if cached_feed['etag']:
+                    headers['If-None-Match'] = cached_feed['etag']
+                if cached_feed['last_modified']:
+                    headers['If-Modified-Since'] = cached_feed['last_modified']
             
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            response = self.session.get(rss_url, headers=headers, stream=True, timeout=30)
             
-            if feed.bozo:
-                logger.warning(f"RSS feed parsing warning: {feed.bozo_exception}")
+            if response.status_code == 304 and cached_feed:
+                logger.info(f"RSS feed not modified, using {len(cached_feed['entries'])} cached entries")
+                yield from cached_feed['entries']
+                return
             
-            if not feed.entries:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            
+            # Parse job cards one at a time
+            entries = []
+            for entry in self._parse_job_cards(response.raw):
+                entries.append(entry)
+                yield entry
+            
+            if not entries:
                 logger.warning("No entries found in RSS feed")
-                return []
+            else:
+                logger.info(f"Successfully fetched {len(entries)} entries from RSS feed")
             
-            logger.info(f"Successfully fetched {len(feed.entries)} entries from RSS feed")
-            return feed.entries
+            # Only a fully read feed is cached, and only if it can be revalidated
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._store_cached_feed(rss_url, etag, last_modified, entries)
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch RSS feed: {e}")
-            return None
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"RSS feed parsing warning: {e}")
         except Exception as e:
             logger.error(f"Unexpected error while fetching RSS feed: {e}")
-            return None
+        finally:
+            if response is not None:
+                response.close()
     
     def scrape_jobs(self, keywords: str, location: str = "", 
                    experience_level: str = "", job_type: str = "",
-                   max_jobs: int = 100) -> List[JobPosting]:
+                   max_jobs: int = 100,
+                   progress_callback: Optional[Callable[[int], None]] = None) -> List[JobPosting]:
         """
         Scrape jobs from LinkedIn RSS feed.
         
@@ -327,6 +465,7 @@ class LinkedInRSScraper:
             experience_level: Experience level filter
             job_type: Job type filter
             max_jobs: Maximum number of jobs to scrape
+            progress_callback: Called with the number of feed entries processed so far
             
         Returns:
             List of JobPosting objects
@@ -337,19 +476,79 @@ class LinkedInRSScraper:
             # Build RSS URL
             rss_url = self.build_linkedin_rss_url(keywords, location, experience_level, job_type)
             
-            # Fetch RSS feed entries
+            # Fetch RSS feed entries lazily, parsing only what is consumed
             entries = self.fetch_rss_feed(rss_url)
-            if not entries:
-                return jobs
             
-            # Process entries
-            for entry in entries[:max_jobs]:
+            # Process entries, stopping as soon as max_jobs have been read
+            try:
+                for i, entry in enumerate(entries):
+                    if i >= max_jobs:
+                        break
+                    job_posting = self.extract_job_details(entry)
+                    if job_posting:
+                        jobs.append(job_posting)
+                    if progress_callback:
+                        progress_callback(i + 1)
+            finally:
+                # Release the streamed response without reading the rest of the feed
+                entries.close()
+            
+            logger.info(f"Successfully scraped {len(jobs)} jobs for keywords: {keywords}")
+            
+        except Exception as e:
+            logger.error(f"Failed to scrape jobs: {e}")
+        
+        return jobs
+    
+    async def fetch_rss_feed_async(self, rss_url: str, max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse RSS feed in a worker thread so the event loop is not blocked.
+        
+        Goes through fetch_rss_feed, so the feed cache and rate limit apply.
+        
+        Args:
+            rss_url: RSS feed URL
+            max_entries: Optional maximum number of entries to parse
+            
+        Returns:
+            List of RSS entries (empty if the request failed)
+        """
+        def fetch_entries() -> List[Dict[str, Any]]:
+            entries = self.fetch_rss_feed(rss_url)
+            try:
+                return list(itertools.islice(entries, max_entries))
+            finally:
+                entries.close()
+        
+        return await asyncio.get_running_loop().run_in_executor(None, fetch_entries)
+    
+    async def scrape_jobs_async(self, keywords: str, location: str = "",
+                                experience_level: str = "", job_type: str = "",
+                                max_jobs: int = 100) -> List[JobPosting]:
+        """
+        Scrape jobs from LinkedIn RSS feed without blocking the event loop.
+        
+        Args:
+            keywords: Job search keywords
+            location: Job location filter
+            experience_level: Experience level filter
+            job_type: Job type filter
+            max_jobs: Maximum number of jobs to scrape
+            
+        Returns:
+            List of JobPosting objects
+        """
+        jobs = []
+        
+        try:
+            rss_url = self.build_linkedin_rss_url(keywords, location, experience_level, job_type)
+            
+            entries = await self.fetch_rss_feed_async(rss_url, max_jobs)
+            
+            for entry in entries:
                 job_posting = self.extract_job_details(entry)
                 if job_posting:
                     jobs.append(job_posting)
-                
-                # Add small delay between processing entries
-                time.sleep(0.1)
             
             logger.info(f"Successfully scraped {len(jobs)} jobs for keywords: {keywords}")
             
@@ -358,10 +557,42 @@ class LinkedInRSScraper:
         
         return jobs
     
+    async def scrape_many(self, queries: List[Dict[str, Any]]) -> List[List[JobPosting]]:
+        """
+        Scrape several keyword/location combinations concurrently.
+        
+        Args:
+            queries: List of scrape_jobs keyword arguments, one dict per search
+            
+        Returns:
+            List of JobPosting lists, in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(self.rate_limiter.config.requests_per_minute)
+        
+        async def scrape_query(query: Dict[str, Any]) -> List[JobPosting]:
+            async with semaphore:
+                return await self.scrape_jobs_async(**query)
+        
+        tasks = [scrape_query(query) for query in queries]
+        completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        for query, task_result in zip(queries, completed_tasks):
+            if isinstance(task_result, Exception):
+                logger.error(f"Scraping failed for keywords {query.get('keywords')}: {task_result}")
+                results.append([])
+            else:
+                results.append(task_result)
+        
+        return results
+    
     def save_jobs_to_database(self, jobs: List[JobPosting]) -> int:
         """
         Save job postings to database.
         
+        Jobs are written by DatabaseManager.insert_jobs in one transaction;
+        rows matching an existing url or job_id are skipped.
+        
         Args:
             jobs: List of JobPosting objects
             
@@ -370,70 +601,40 @@ class LinkedInRSScraper:
         """
         saved_count = 0
         
+        if not jobs:
+            return saved_count
+        
         try:
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            for job in jobs:
-                try:
-                    # Check if job already exists (by URL or job_id)
-                    existing_query = """
-                    SELECT id FROM jobs 
-                    WHERE url = ? OR (job_id IS NOT NULL AND job_id = ?)
-                    """
-                    cursor.execute(existing_query, (job.url, job.job_id))
-                    
-                    if cursor.fetchone():
-                        logger.debug(f"Job already exists, skipping: {job.title}")
-                        continue
-                    
-                    # Insert new job
-                    insert_query = """
-                    INSERT INTO jobs (
-                        title, company, location, description, url, posted_date,
-                        source, job_id, salary_range, employment_type, 
-                        experience_level, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    
-                    cursor.execute(insert_query, (
-                        job.title,
-                        job.company,
-                        job.location,
-                        job.description,
-                        job.url,
-                        job.posted_date,
-                        job.source,
-                        job.job_id,
-                        job.salary_range,
-                        job.employment_type,
-                        job.experience_level,
-                        datetime.now(timezone.utc)
-                    ))
-                    
-                    saved_count += 1
-                    logger.debug(f"Saved job: {job.title} at {job.company}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to save job {job.title}: {e}")
-                    continue
-            
-            conn.commit()
+            # Duplicates are skipped by the unique url/job_id indexes
+            created_at = datetime.now(timezone.utc)
+            saved_count = self.db_manager.insert_jobs([
+                {
+                    'title': job.title,
+                    'company': job.company,
+                    'location': job.location,
+                    'description': job.description,
+                    'url': job.url,
+                    'posted_date': job.posted_date,
+                    'source': job.source,
+                    'job_id': job.job_id,
+                    'salary_range': job.salary_range,
+                    'employment_type': job.employment_type,
+                    'experience_level': job.experience_level,
+                    'created_at': created_at
+                }
+                for job in jobs
+            ])
             logger.info(f"Successfully saved {saved_count} jobs to database")
             
         except Exception as e:
             logger.error(f"Database error while saving jobs: {e}")
-            if conn:
-                conn.rollback()
-        finally:
-            if conn:
-                conn.close()
         
         return saved_count
     
     def scrape_and_save_jobs(self, keywords: str, location: str = "",
                            experience_level: str = "", job_type: str = "",
-                           max_jobs: int = 100) -> Dict[str, int]:
+                           max_jobs: int = 100,
+                           progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, int]:
         """
         Scrape jobs and save them to database in one operation.
         
@@ -443,6 +644,7 @@ class LinkedInRSScraper:
             experience_level: Experience level filter
             job_type: Job type filter
             max_jobs: Maximum number of jobs to scrape
+            progress_callback: Called with the number of feed entries processed so far
             
         Returns:
             Dictionary with scraping results
@@ -450,7 +652,8 @@ class LinkedInRSScraper:
         start_time = time.time()
         
         # Scrape jobs
-        jobs = self.scrape_jobs(keywords, location, experience_level, job_type, max_jobs)
+        jobs = self.scrape_jobs(keywords, location, experience_level, job_type, max_jobs,
+                                progress_callback=progress_callback)
         
         # Save to database
         saved_count = self.save_jobs_to_database(jobs)
@@ -466,5 +669,37 @@ class LinkedInRSScraper:
             'location': location
         }
         
+        logger.info(f"Scraping completed: {results}")
+        return results
+    
+    def scrape_and_save_many(self, queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Scrape several searches concurrently and save all results to the database.
+        
+        Args:
+            queries: List of scrape_jobs keyword arguments, one dict per search
+            
+        Returns:
+            Dictionary with scraping results
+        """
+        start_time = time.time()
+        
+        # Scrape jobs for all queries
+        job_lists = asyncio.run(self.scrape_many(queries))
+        jobs = [job for job_list in job_lists for job in job_list]
+        
+        # Save to database
+        saved_count = self.save_jobs_to_database(jobs)
+        
+        end_time = time.time()
+        duration = end_time - start_time
+        
+        results = {
+            'query_count': len(queries),
+            'scraped_count': len(jobs),
+            'saved_count': saved_count,
+            'duration_seconds': round(duration, 2)
+        }
+        
         logger.info(f"Scraping completed: {results}")
         return results
\ No newline at end of file
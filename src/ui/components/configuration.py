@@ -6,107 +6,242 @@ including LLM providers, user information, scraping parameters, and advanced opt
 """
 
 import streamlit as st
+import asyncio
+import concurrent.futures
+import copy
+import hashlib
 import json
+import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 import sys
 
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path for imports (once; reloads must not stack duplicates)
+project_root = str(Path(__file__).resolve().parents[3])
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from src.config import validate_config, config_manager
-from src.ui.utils.styling import create_info_card, create_status_badge
+from src.ui.utils.styling import create_info_card, create_metric_card, create_status_badge
+from src.ui.utils.background import get_event_loop
+
+# Selectbox options
+LLM_MODELS = (
+    "anthropic/claude-3.5-sonnet",
+    "openai/gpt-4o",
+    "openai/gpt-4o-mini",
+    "meta-llama/llama-3.1-8b-instruct",
+    "google/gemini-pro-1.5",
+    "anthropic/claude-3-haiku"
+)
+LLM_MODEL_INDEX = {model: i for i, model in enumerate(LLM_MODELS)}
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LOG_LEVEL_INDEX = {level: i for i, level in enumerate(LOG_LEVELS)}
+
+# Fallbacks for settings that are not (yet) fields on the config dataclasses
+LLM_DEFAULTS = MappingProxyType({'timeout': 60})
+USER_DEFAULTS = MappingProxyType({
+    'portfolio_url': '',
+    'website_url': '',
+    'summary': '',
+    'skills': '',
+    'preferred_titles': ''
+})
+CONTACT_FINDER_DEFAULTS = MappingProxyType({
+    'max_contacts_per_company': 5,
+    'validate_emails': True,
+    'confidence_threshold': 0.7
+})
+APP_DEFAULTS = MappingProxyType({'max_log_size_mb': 10})
+
+# Provider test prompts and (error keywords, tip) troubleshooting hints
+_GENERIC_TEST_MSGS = (
+    MappingProxyType({"role": "user", "content": "This is a connection test. Please respond with exactly: 'Connection test successful - LLM is working properly'"}),
+)
+_OPENROUTER_TEST_MSGS = (
+    MappingProxyType({"role": "user", "content": "This is an OpenRouter API connection test. Please respond with exactly: 'OpenRouter API connection successful - service is working properly'"}),
+)
+_OLLAMA_TEST_MSGS = (
+    MappingProxyType({"role": "user", "content": "This is a local LLM connection test. Please respond with exactly: 'Local LLM connection successful - model is working properly'"}),
+)
+_OPENROUTER_TEST_HINTS = (
+    (("api key",), "Make sure your OpenRouter API key is valid and has sufficient credits."),
+    (("network", "timeout"), "Check your internet connection and try again.")
+)
+_OLLAMA_TEST_HINTS = (
+    (("connection",), "Make sure Ollama is running with `ollama serve`"),
+)
+
+# Successful test replies by (provider, model, base URL, key hash, prompt hash)
+TEST_RESULT_TTL_SECONDS = 60
+_test_results = {}
+
+def _env_file_signature():
+    """Identify the current revision of the .env file by path, mtime and size."""
+    env_path = Path(config_manager.env_file)
+    try:
+        env_stat = env_path.stat()
+        return (str(env_path), env_stat.st_mtime_ns, env_stat.st_size)
+    except FileNotFoundError:
+        return (str(env_path), None, None)
+
+def _staged_config(staged):
+    """The saved configuration, or a copy of it with a session's staged updates applied."""
+    config = config_manager.get_app_config()
+    if not staged:
+        return config
+    
+    config = copy.deepcopy(config)
+    config_manager.update_many(staged.items(), config=config)
+    return config
+
+@st.cache_data(ttl=60)
+def _export_config_json(env_signature, staged) -> bytes:
+    """Serialize the masked configuration, staged updates included; cached per .env revision."""
+    return json.dumps(config_manager.mask_sensitive_config(_staged_config(staged)), indent=2).encode()
+
+@st.cache_data(ttl=30)
+def _cached_provider_status(_llm_manager, manager_id, revision):
+    """
+    Available providers and provider details for display.
+    
+    Cached briefly because Ollama availability checks probe the network;
+    revision is bumped on save and on provider tests to force a refresh.
+    """
+    return _llm_manager.get_available_providers(), _llm_manager.get_provider_info()
+
+def _run_async(coro, live=()):
+    """
+    Run a coroutine on the background event loop and wait for its result.
+    
+    live holds (report, placeholder) pairs; while waiting, each placeholder
+    shows the report's partially streamed reply.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+    while live and not future.done():
+        concurrent.futures.wait([future], timeout=0.1)
+        for report, placeholder in live:
+            if report.streaming:
+                placeholder.info(f"**Response:** {report.streaming}")
+    
+    for _, placeholder in live:
+        placeholder.empty()
+    return future.result()
+
+def _test_cache_key(llm_manager, provider_name, messages):
+    """Key a provider test on everything that affects its outcome, without the raw API key."""
+    provider = llm_manager.get_provider(provider_name)
+    api_key = llm_manager.config.openrouter_api_key if provider_name == "openrouter" else ""
+    return (
+        provider_name,
+        provider.get_model_name() if provider else "",
+        getattr(provider, "base_url", ""),
+        hashlib.blake2b((api_key or "").encode(), digest_size=8).hexdigest(),
+        hashlib.blake2b(json.dumps([dict(m) for m in messages]).encode(), digest_size=8).hexdigest()
+    )
+
+class _TestReport:
+    """
+    Provider test output recorded on the event loop thread.
+    
+    Streamlit elements can only be created from the script thread, so the
+    messages are rendered onto a container once the test has finished.
+    """
+    
+    def __init__(self):
+        self.messages = []
+        self.streaming = ""
+    
+    def success(self, body):
+        self.messages.append(("success", body))
+    
+    def info(self, body):
+        self.messages.append(("info", body))
+    
+    def warning(self, body):
+        self.messages.append(("warning", body))
+    
+    def error(self, body):
+        self.messages.append(("error", body))
+    
+    def render(self, container):
+        """Write the recorded messages to a Streamlit container."""
+        for kind, body in self.messages:
+            getattr(container, kind)(body)
+
+@st.cache_resource
+def _get_llm_manager():
+    """LLM manager shared by the provider tests; cleared when configuration is saved."""
+    from src.ai_processing import LLMManager
+    return LLMManager()
+
+@st.cache_data(ttl=30)
+def _available_providers(_llm_manager, manager_id, revision):
+    """Names of the reachable providers; revision is bumped to force a re-check."""
+    return tuple(_llm_manager.get_available_providers())
 
 class ConfigurationTab:
     """Configuration tab component for managing all system settings."""
     
     def __init__(self):
         """Initialize the configuration tab."""
-        self.config = st.session_state.get('config')
+        self._bind_config(st.session_state.get('config'))
+    
+    def _bind_config(self, config):
+        """Hold the config and its section shortcuts, resolved once."""
+        self.config = config
+        self._llm = config.llm if config else None
+        self._user = config.user if config else None
+        self._scr = config.scraping if config else None
+        self._cf = config.contact_finder if config else None
         
     def render(self):
-        """Render the configuration tab content."""
+        """
+        Render the configuration tab content.
+        
+        The status panel and each settings section are fragments, so widget
+        changes inside a section rerun only that section.
+        """
         st.markdown("### ⚙️ System Configuration")
         
         # Configuration validation status
         self._render_validation_status()
         
+        # Section saves are staged in memory until written together
+        self._render_pending_changes()
+        
         # Configuration sections
         self._render_configuration_sections()
     
+    @st.fragment
     def _render_validation_status(self):
         """Render configuration validation status."""
         st.markdown("#### 🔍 Configuration Status")
         
         try:
-            # Force reload configuration to ensure fresh validation
-            config_manager.load_config()
-            validation_issues = validate_config()
+            validation_issues = self._get_validation_issues()
             
-            col1, col2, col3 = st.columns(3)
+            error_count = len(validation_issues["errors"])
+            warning_count = len(validation_issues["warnings"])
+            has_issues = bool(error_count or warning_count)
             
-            with col1:
-                if validation_issues["errors"]:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-error">{len(validation_issues["errors"])}</div>
-                        <div class="metric-label">Errors</div>
-                    </div>
-                    """
-                else:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-healthy">0</div>
-                        <div class="metric-label">Errors</div>
-                    </div>
-                    """
-                st.markdown(status_html, unsafe_allow_html=True)
-            
-            with col2:
-                if validation_issues["warnings"]:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-warning">{len(validation_issues["warnings"])}</div>
-                        <div class="metric-label">Warnings</div>
-                    </div>
-                    """
-                else:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-healthy">0</div>
-                        <div class="metric-label">Warnings</div>
-                    </div>
-                    """
-                st.markdown(status_html, unsafe_allow_html=True)
-            
-            with col3:
-                if not validation_issues["errors"] and not validation_issues["warnings"]:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-healthy">✅</div>
-                        <div class="metric-label">Status</div>
-                    </div>
-                    """
-                else:
-                    status_html = f"""
-                    <div class="metric-card">
-                        <div class="metric-value status-error">⚠️</div>
-                        <div class="metric-label">Status</div>
-                    </div>
-                    """
-                st.markdown(status_html, unsafe_allow_html=True)
+            # All three status cards in a single markdown element
+            cards_html = (
+                '<div class="metric-row">'
+                + create_metric_card(error_count, "Errors", "error" if error_count else "healthy")
+                + create_metric_card(warning_count, "Warnings", "warning" if warning_count else "healthy")
+                + create_metric_card("⚠️" if has_issues else "✅", "Status", "error" if has_issues else "healthy")
+                + '</div>'
+            )
+            st.markdown(cards_html, unsafe_allow_html=True)
             
             # Display issues if any
             if validation_issues["errors"]:
-                st.error("**Configuration Errors:**")
-                for error in validation_issues["errors"]:
-                    st.error(f"• {error}")
+                st.error("**Configuration Errors:**\n\n" + "\n".join(f"- {error}" for error in validation_issues["errors"]))
             
             if validation_issues["warnings"]:
-                st.warning("**Configuration Warnings:**")
-                for warning in validation_issues["warnings"]:
-                    st.warning(f"• {warning}")
+                st.warning("**Configuration Warnings:**\n\n" + "\n".join(f"- {warning}" for warning in validation_issues["warnings"]))
             
             if not validation_issues["errors"] and not validation_issues["warnings"]:
                 st.success("✅ All configuration settings are valid!")
@@ -114,35 +249,70 @@ class ConfigurationTab:
         except Exception as e:
             st.error(f"Error validating configuration: {str(e)}")
     
+    def _render_pending_changes(self):
+        """Offer to apply this session's staged configuration changes and write them to the .env file."""
+        staged = st.session_state.get('_cfg_staged')
+        if not staged:
+            return
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.warning("⚠️ Configuration changes are staged but not yet saved to the .env file.")
+        with col2:
+            if st.button("💾 Save All Changes", width="stretch", type="primary"):
+                try:
+                    config_manager.update_many(staged.items())
+                    config_manager.save_to_env_file()
+                    del st.session_state['_cfg_staged']
+                    self._publish_saved_config()
+                    st.success("✅ Configuration saved successfully!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Failed to save configuration: {str(e)}")
+    
+    def _get_validation_issues(self):
+        """
+        Reload and validate configuration, reusing the last result while the
+        .env file is unchanged (same path, mtime and size).
+        """
+        signature = _env_file_signature()
+        cached = st.session_state.get('_cfg_cache')
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        # Reload configuration so validation reflects the file on disk
+        config_manager.load_config()
+        validation_issues = validate_config()
+        st.session_state['_cfg_cache'] = (signature, validation_issues)
+        return validation_issues
+    
     def _render_configuration_sections(self):
-        """Render all configuration sections in tabs."""
+        """Render the selected configuration section."""
         if not self.config:
             st.error("Configuration not loaded. Please check system status.")
             return
         
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "🤖 LLM Settings", 
-            "👤 User Profile", 
-            "🕷️ Scraping", 
-            "📧 Contact Finder",
-            "🔧 Advanced"
-        ])
-        
-        with tab1:
-            self._render_llm_settings()
-        
-        with tab2:
-            self._render_user_profile()
+        # Only the selected section's widgets are built on each rerun
+        sections = {
+            "🤖 LLM Settings": self._render_llm_settings,
+            "👤 User Profile": self._render_user_profile,
+            "🕷️ Scraping": self._render_scraping_settings,
+            "📧 Contact Finder": self._render_contact_finder_settings,
+            "🔧 Advanced": self._render_advanced_settings
+        }
         
-        with tab3:
-            self._render_scraping_settings()
-        
-        with tab4:
-            self._render_contact_finder_settings()
+        section = st.segmented_control(
+            "Configuration Section",
+            options=list(sections),
+            default="🤖 LLM Settings",
+            key="cfg_section",
+            label_visibility="collapsed"
+        )
         
-        with tab5:
-            self._render_advanced_settings()
+        # Deselecting the active segment returns None; fall back to the first section
+        sections.get(section, self._render_llm_settings)()
     
+    @st.fragment
     def _render_llm_settings(self):
         """Render LLM configuration settings."""
         st.markdown("#### 🤖 Language Model Configuration")
@@ -152,7 +322,7 @@ class ConfigurationTab:
         provider_choice = st.radio(
             "LLM Provider",  # Provide a proper label
             options=["OpenRouter", "Local LLM"],
-            index=0 if not self.config.llm.use_local_llm else 1,
+            index=0 if not self._llm.use_local_llm else 1,
             horizontal=True,
             help="Choose between cloud-based OpenRouter or local Ollama instance",
             label_visibility="collapsed"  # Hide the label since we have markdown above
@@ -163,54 +333,51 @@ class ConfigurationTab:
         if use_local:
             st.info("ℹ️ **Local LLM Setup:** If using local LLM, ensure Ollama is running. Use the test button below to verify connectivity.")
         
+        llm_settings = {**LLM_DEFAULTS, **vars(self._llm)}
+        
         # Configuration form
-        with st.form("llm_config_form"):
-            # Always show all configuration options, but highlight the active one
+        with st.form("llm_config_form", clear_on_submit=False):
+            # Only the active provider's fields are built; the other keeps its saved values
             col1, col2 = st.columns(2)
             
-            # Determine disabled states
-            openrouter_disabled = (provider_choice != "OpenRouter")
-            local_disabled = (provider_choice != "Local LLM")
-            
             with col1:
                 st.markdown("**OpenRouter API:**")
-                openrouter_key = st.text_input(
-                    "OpenRouter API Key",
-                    value="***" if self.config.llm.openrouter_api_key else "",
-                    type="password",
-                    help="Get your API key from openrouter.ai",
-                    disabled=openrouter_disabled
-                )
-                
-                default_model = st.selectbox(
-                    "Default Model",
-                    options=[
-                        "anthropic/claude-3.5-sonnet",
-                        "openai/gpt-4o",
-                        "openai/gpt-4o-mini",
-                        "meta-llama/llama-3.1-8b-instruct",
-                        "google/gemini-pro-1.5",
-                        "anthropic/claude-3-haiku"
-                    ],
-                    index=0 if not hasattr(self.config.llm, 'default_model') else 0,
-                    disabled=openrouter_disabled
-                )
+                if provider_choice == "OpenRouter":
+                    openrouter_key = st.text_input(
+                        "OpenRouter API Key",
+                        value=self._mask_secrets()['openrouter'],
+                        type="password",
+                        help="Get your API key from openrouter.ai"
+                    )
+                    
+                    default_model = st.selectbox(
+                        "Default Model",
+                        options=LLM_MODELS,
+                        index=LLM_MODEL_INDEX.get(llm_settings['default_model'], 0)
+                    )
+                else:
+                    st.caption("Inactive provider - settings hidden and left unchanged")
+                    openrouter_key = ""
+                    default_model = llm_settings['default_model']
             
             with col2:
                 st.markdown("**Local LLM (Ollama):**")
-                local_model = st.text_input(
-                    "Local Model Name",
-                    value=self.config.llm.local_llm_model,
-                    help="e.g., qwen2.5:32b, llama3.1:8b",
-                    disabled=local_disabled
-                )
-                
-                ollama_url = st.text_input(
-                    "Ollama Base URL",
-                    value=self.config.llm.ollama_base_url,
-                    help="Usually http://localhost:11434",
-                    disabled=local_disabled
-                )
+                if provider_choice == "Local LLM":
+                    local_model = st.text_input(
+                        "Local Model Name",
+                        value=self._llm.local_llm_model,
+                        help="e.g., qwen2.5:32b, llama3.1:8b"
+                    )
+                    
+                    ollama_url = st.text_input(
+                        "Ollama Base URL",
+                        value=self._llm.ollama_base_url,
+                        help="Usually http://localhost:11434"
+                    )
+                else:
+                    st.caption("Inactive provider - settings hidden and left unchanged")
+                    local_model = self._llm.local_llm_model
+                    ollama_url = self._llm.ollama_base_url
             
             # Advanced LLM settings
             st.markdown("---")
@@ -222,7 +389,7 @@ class ConfigurationTab:
                     "Temperature",
                     min_value=0.0,
                     max_value=2.0,
-                    value=self.config.llm.temperature,
+                    value=self._llm.temperature,
                     step=0.1,
                     help="Controls randomness in responses"
                 )
@@ -232,7 +399,7 @@ class ConfigurationTab:
                     "Max Tokens",
                     min_value=100,
                     max_value=8000,
-                    value=self.config.llm.max_tokens,
+                    value=self._llm.max_tokens,
                     step=100,
                     help="Maximum response length"
                 )
@@ -242,7 +409,7 @@ class ConfigurationTab:
                     "Timeout (seconds)",
                     min_value=10,
                     max_value=300,
-                    value=getattr(self.config.llm, 'timeout', 60),
+                    value=llm_settings['timeout'],
                     step=5,
                     help="Request timeout"
                 )
@@ -254,23 +421,50 @@ class ConfigurationTab:
                     ollama_url, temperature, max_tokens, timeout
                 )
         
-        # Test buttons for current configuration - after the form
+        # Test buttons and provider status rerun on their own, not with the form
+        self._render_llm_test_buttons()
+        self._render_llm_provider_status()
+    
+    @st.fragment
+    def _render_llm_test_buttons(self):
+        """Render the provider test buttons."""
         st.markdown("**Test LLM Providers:**")
-        col_test1, col_test2 = st.columns(2)
+        col_test1, col_test2, col_test3 = st.columns(3)
         
         with col_test1:
             if st.button("🧪 Test OpenRouter API", width="stretch"):
                 self._test_openrouter_connection()
+                self._invalidate_provider_status()
         
         with col_test2:
             if st.button("🧪 Test Local LLM", width="stretch"):
                 self._test_ollama_connection()
+                self._invalidate_provider_status()
+        
+        with col_test3:
+            if st.button("🧪 Test All Providers", width="stretch"):
+                self._test_all_providers()
+                self._invalidate_provider_status()
         
-        # Current LLM status - at the bottom
+        st.checkbox(
+            "Run generation probe for Local LLM",
+            key="ollama_generation_probe",
+            help="Also generate a short reply; otherwise the test only checks that Ollama is reachable and the model is pulled"
+        )
+        st.checkbox(
+            "Force retest",
+            key="force_retest",
+            help=f"Ignore successful results from the last {TEST_RESULT_TTL_SECONDS} seconds"
+        )
+    
+    @st.fragment
+    def _render_llm_provider_status(self):
+        """Render available providers with their details and test buttons."""
         llm_manager = st.session_state.get('llm_manager')
         if llm_manager:
-            providers = llm_manager.get_available_providers()
-            provider_info = llm_manager.get_provider_info()
+            providers, provider_info = _cached_provider_status(
+                llm_manager, id(llm_manager), st.session_state.get('_llm_rev', 0)
+            )
             
             if providers:
                 st.success(f"✅ Available providers: {', '.join(providers)}")
@@ -278,46 +472,48 @@ class ConfigurationTab:
                 # Show provider details with test buttons
                 for provider, info in provider_info.items():
                     with st.expander(f"{provider.title()} Provider Details"):
-                        col1, col2, col3 = st.columns([2, 2, 1])
-                        with col1:
-                            st.write(f"**Status:** {'🟢 Available' if info['available'] else '🔴 Unavailable'}")
-                            st.write(f"**Model:** {info['model']}")
-                        with col2:
-                            st.write(f"**Primary:** {'Yes' if info['is_primary'] else 'No'}")
-                        with col3:
-                            if st.button(f"🧪 Test {provider.title()}", key=f"config_test_{provider}"):
-                                self._test_llm_provider(provider, llm_manager)
+                        st.markdown(
+                            "| Status | Model | Primary |\n"
+                            "|---|---|---|\n"
+                            f"| {'🟢 Available' if info['available'] else '🔴 Unavailable'} "
+                            f"| {info['model']} "
+                            f"| {'Yes' if info['is_primary'] else 'No'} |"
+                        )
+                        if st.button(f"🧪 Test {provider.title()}", key=f"config_test_{provider}"):
+                            self._test_llm_provider(provider, llm_manager)
+                            self._invalidate_provider_status()
             else:
                 st.error("❌ No LLM providers configured!")
     
+    @st.fragment
     def _render_user_profile(self):
         """Render user profile configuration."""
         st.markdown("#### 👤 User Profile Information")
         
-        user_config = self.config.user
+        user_config = {**USER_DEFAULTS, **vars(self._user)}
         
-        with st.form("user_profile_form"):
+        with st.form("user_profile_form", clear_on_submit=False):
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**Personal Information:**")
-                name = st.text_input("Full Name*", value=user_config.name)
-                email = st.text_input("Email Address*", value=user_config.email)
-                phone = st.text_input("Phone Number", value=user_config.phone)
-                location = st.text_input("Location", value=user_config.location)
+                name = st.text_input("Full Name*", value=user_config['name'])
+                email = st.text_input("Email Address*", value=user_config['email'])
+                phone = st.text_input("Phone Number", value=user_config['phone'])
+                location = st.text_input("Location", value=user_config['location'])
             
             with col2:
                 st.markdown("**Professional Links:**")
-                linkedin_url = st.text_input("LinkedIn URL", value=user_config.linkedin_url)
-                github_url = st.text_input("GitHub URL", value=user_config.github_url)
-                portfolio_url = st.text_input("Portfolio URL", value=getattr(user_config, 'portfolio_url', ''))
-                website_url = st.text_input("Personal Website", value=getattr(user_config, 'website_url', ''))
+                linkedin_url = st.text_input("LinkedIn URL", value=user_config['linkedin_url'])
+                github_url = st.text_input("GitHub URL", value=user_config['github_url'])
+                portfolio_url = st.text_input("Portfolio URL", value=user_config['portfolio_url'])
+                website_url = st.text_input("Personal Website", value=user_config['website_url'])
             
             # Professional summary
             st.markdown("**Professional Summary:**")
             summary = st.text_area(
                 "Professional Summary",
-                value=getattr(user_config, 'summary', ''),
+                value=user_config['summary'],
                 help="Brief professional summary for email templates",
                 height=100
             )
@@ -329,7 +525,7 @@ class ConfigurationTab:
                 st.markdown("**Key Skills:**")
                 skills = st.text_area(
                     "Technical Skills",
-                    value=getattr(user_config, 'skills', ''),
+                    value=user_config['skills'],
                     help="Comma-separated list of skills",
                     height=80
                 )
@@ -338,7 +534,7 @@ class ConfigurationTab:
                 st.markdown("**Job Preferences:**")
                 job_titles = st.text_area(
                     "Preferred Job Titles",
-                    value=getattr(user_config, 'preferred_titles', ''),
+                    value=user_config['preferred_titles'],
                     help="Comma-separated list of job titles",
                     height=80
                 )
@@ -349,13 +545,14 @@ class ConfigurationTab:
                     portfolio_url, website_url, summary, skills, job_titles
                 )
     
+    @st.fragment
     def _render_scraping_settings(self):
         """Render web scraping configuration."""
         st.markdown("#### 🕷️ Web Scraping Configuration")
         
-        scraping_config = self.config.scraping
+        scraping_config = self._scr
         
-        with st.form("scraping_config_form"):
+        with st.form("scraping_config_form", clear_on_submit=False):
             col1, col2 = st.columns(2)
             
             with col1:
@@ -416,26 +613,26 @@ class ConfigurationTab:
             with col3:
                 use_proxy = st.checkbox(
                     "Use Proxy Rotation",
-                    value=getattr(scraping_config, 'use_proxy', False),
+                    value=scraping_config.use_proxy,
                     help="Enable proxy rotation for scraping"
                 )
                 
                 headless_browser = st.checkbox(
                     "Headless Browser Mode",
-                    value=getattr(scraping_config, 'headless', True),
+                    value=scraping_config.headless,
                     help="Run browser in headless mode"
                 )
             
             with col4:
                 respect_robots = st.checkbox(
                     "Respect robots.txt",
-                    value=getattr(scraping_config, 'respect_robots', True),
+                    value=scraping_config.respect_robots,
                     help="Follow robots.txt guidelines"
                 )
                 
                 cache_responses = st.checkbox(
                     "Cache Responses",
-                    value=getattr(scraping_config, 'cache_responses', True),
+                    value=scraping_config.cache_responses,
                     help="Cache responses to avoid duplicate requests"
                 )
             
@@ -446,45 +643,51 @@ class ConfigurationTab:
                     respect_robots, cache_responses
                 )
     
+    @st.fragment
     def _render_contact_finder_settings(self):
         """Render contact finder configuration."""
         st.markdown("#### 📧 Contact Finder Configuration")
         
-        contact_config = self.config.contact_finder
+        contact_config = {**CONTACT_FINDER_DEFAULTS, **vars(self._cf)}
         
         # Contact method selector outside the form for dynamic updates
         st.markdown("---")
         contact_method = st.radio(
             "Select Contact Discovery Method:",
             options=["API Services", "Free Email Discovery"],
-            index=1 if contact_config.use_free_methods else 0,
+            index=1 if contact_config['use_free_methods'] else 0,
             horizontal=True,
             help="Choose between paid API services or free discovery methods"
         )
         use_free_methods = contact_method == "Free Email Discovery"
         st.markdown("---")
         
-        with st.form("contact_finder_form"):
-            # Always show all configuration options, but highlight the active one
+        with st.form("contact_finder_form", clear_on_submit=False):
+            # API key fields are only built when API services are selected
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**API Services:**")
-                hunter_key = st.text_input(
-                    "Hunter.io API Key",
-                    value="***" if contact_config.hunter_io_api_key else "",
-                    type="password",
-                    help="Get your API key from hunter.io",
-                    disabled=(contact_method != "API Services")
-                )
-                
-                apollo_key = st.text_input(
-                    "Apollo.io API Key",
-                    value="***" if contact_config.apollo_io_api_key else "",
-                    type="password",
-                    help="Get your API key from apollo.io",
-                    disabled=(contact_method != "API Services")
-                )
+                if contact_method == "API Services":
+                    masked_secrets = self._mask_secrets()
+                    hunter_key = st.text_input(
+                        "Hunter.io API Key",
+                        value=masked_secrets['hunter_io'],
+                        type="password",
+                        help="Get your API key from hunter.io"
+                    )
+                    
+                    apollo_key = st.text_input(
+                        "Apollo.io API Key",
+                        value=masked_secrets['apollo_io'],
+                        type="password",
+                        help="Get your API key from apollo.io"
+                    )
+                else:
+                    # Empty keys are skipped on save, so stored keys are kept
+                    st.caption("API services inactive - keys hidden and left unchanged")
+                    hunter_key = ""
+                    apollo_key = ""
             
             with col2:
                 st.markdown("**Search Options:**")
@@ -492,7 +695,7 @@ class ConfigurationTab:
                     "Max Contacts per Company",
                     min_value=1,
                     max_value=20,
-                    value=getattr(contact_config, 'max_contacts_per_company', 5),
+                    value=contact_config['max_contacts_per_company'],
                     help="Maximum contacts to find per company"
                 )
                 
@@ -509,7 +712,7 @@ class ConfigurationTab:
             with col3:
                 validate_emails = st.checkbox(
                     "Validate Email Addresses",
-                    value=getattr(contact_config, 'validate_emails', True),
+                    value=contact_config['validate_emails'],
                     help="Verify email addresses before use"
                 )
             
@@ -518,7 +721,7 @@ class ConfigurationTab:
                     "Confidence Threshold",
                     min_value=0.1,
                     max_value=1.0,
-                    value=getattr(contact_config, 'confidence_threshold', 0.7),
+                    value=contact_config['confidence_threshold'],
                     step=0.1,
                     help="Minimum confidence score for contacts"
                 )
@@ -529,20 +732,23 @@ class ConfigurationTab:
                     validate_emails, confidence_threshold
                 )
     
+    @st.fragment
     def _render_advanced_settings(self):
         """Render advanced system settings."""
         st.markdown("#### 🔧 Advanced System Settings")
         
+        app_settings = {**APP_DEFAULTS, **vars(self.config)}
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Logging configuration
             st.markdown("**Logging Configuration:**")
-            with st.form("logging_form"):
+            with st.form("logging_form", clear_on_submit=False):
                 log_level = st.selectbox(
                     "Log Level",
-                    options=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-                    index=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"].index(self.config.log_level)
+                    options=LOG_LEVELS,
+                    index=LOG_LEVEL_INDEX.get(self.config.log_level, LOG_LEVEL_INDEX["INFO"])
                 )
                 
                 log_to_file = st.checkbox(
@@ -554,7 +760,7 @@ class ConfigurationTab:
                     "Max Log File Size (MB)",
                     min_value=1,
                     max_value=100,
-                    value=getattr(self.config, 'max_log_size_mb', 10),
+                    value=app_settings['max_log_size_mb'],
                     help="Maximum size before log rotation"
                 )
                 
@@ -571,7 +777,7 @@ class ConfigurationTab:
             <strong>Log Directory:</strong> {self.config.data_dir}/logs<br><br>
             <strong>Current Log Level:</strong> {self.config.log_level}<br>
             <strong>File Logging:</strong> {'Enabled' if self.config.log_to_file else 'Disabled'}<br>
-            <strong>Free Contact Methods:</strong> {'Enabled' if self.config.contact_finder.use_free_methods else 'Disabled'}
+            <strong>Free Contact Methods:</strong> {'Enabled' if self._cf.use_free_methods else 'Disabled'}
             """
             st.markdown(create_info_card("System Directories", info_content), unsafe_allow_html=True)
         
@@ -582,10 +788,9 @@ class ConfigurationTab:
         with col3:
             if st.button("📥 Export Configuration", width="stretch"):
                 try:
-                    config_dict = config_manager.mask_sensitive_config()
                     st.download_button(
                         "💾 Download Config JSON",
-                        data=json.dumps(config_dict, indent=2),
+                        data=_export_config_json(_env_file_signature(), st.session_state.get('_cfg_staged', {})),
                         file_name=f"ai_job_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json",
                         width="stretch"
@@ -596,7 +801,8 @@ class ConfigurationTab:
         with col4:
             if st.button("🔄 Reload Configuration", width="stretch"):
                 try:
-                    # Refresh session state
+                    # Refresh session state, discarding unsaved staged changes
+                    st.session_state.pop('_cfg_staged', None)
                     if 'config' in st.session_state:
                         del st.session_state['config']
                     st.success("Configuration reloaded successfully!")
@@ -610,31 +816,88 @@ class ConfigurationTab:
                 if st.button("Confirm Reset", type="primary", key="confirm_reset"):
                     st.info("🚧 Reset functionality will be implemented in a future version")
     
+    def _mask_secrets(self):
+        """
+        Placeholder values for the API key inputs ('***' when a key is set).
+        
+        Memoized in session state per config object and save revision.
+        """
+        cache_key = (id(self.config), st.session_state.get('_cfg_rev', 0))
+        cached = st.session_state.get('_masked_secrets')
+        if cached and cached[0] == cache_key:
+            return cached[1]
+        
+        llm_config = self._llm
+        contact_config = self._cf
+        masked = MappingProxyType({
+            'openrouter': "***" if llm_config.openrouter_api_key else "",
+            'hunter_io': "***" if contact_config.hunter_io_api_key else "",
+            'apollo_io': "***" if contact_config.apollo_io_api_key else ""
+        })
+        st.session_state['_masked_secrets'] = (cache_key, masked)
+        return masked
+    
+    def _publish_saved_config(self):
+        """
+        Hand the just-saved configuration to the next rerun.
+        
+        The session config is replaced with the updated object and the
+        validation cache is seeded for the current .env file, so the rerun
+        neither re-reads the file nor re-validates.
+        """
+        st.session_state['config'] = config_manager.get_app_config()
+        self._bind_config(st.session_state['config'])
+        st.session_state['_cfg_cache'] = (_env_file_signature(), validate_config())
+        st.session_state['_cfg_rev'] = st.session_state.get('_cfg_rev', 0) + 1
+        _get_llm_manager.clear()
+    
+    def _stage_config(self, updates):
+        """
+        Stage section updates for this browser session only.
+        
+        config_manager is shared by every session, so edits stay in session
+        state (shown through a copy of the config) until Save All Changes
+        applies and writes them.
+        """
+        staged = st.session_state.setdefault('_cfg_staged', {})
+        staged.update(updates)
+        st.session_state['config'] = _staged_config(staged)
+        self._bind_config(st.session_state['config'])
+        st.session_state['_cfg_rev'] = st.session_state.get('_cfg_rev', 0) + 1
+    
+    def _available_providers(self, llm_manager):
+        """Reachable providers for llm_manager, cached until the next status refresh."""
+        return _available_providers(llm_manager, id(llm_manager), st.session_state.get('_llm_rev', 0))
+    
+    def _invalidate_provider_status(self):
+        """Force provider availability to be re-checked on the next render."""
+        st.session_state['_llm_rev'] = st.session_state.get('_llm_rev', 0) + 1
+    
     def _save_llm_config(self, openrouter_key, default_model, use_local, local_model, 
                          ollama_url, temperature, max_tokens, timeout):
         """Save LLM configuration."""
         try:
-            updates = {
-                'llm.default_model': default_model,
-                'llm.use_local_llm': use_local,
-                'llm.local_llm_model': local_model,
-                'llm.ollama_base_url': ollama_url,
-                'llm.temperature': temperature,
-                'llm.max_tokens': max_tokens,
-                'llm.timeout': timeout
-            }
+            updates = [
+                ('llm.default_model', default_model),
+                ('llm.use_local_llm', use_local),
+                ('llm.local_llm_model', local_model),
+                ('llm.ollama_base_url', ollama_url),
+                ('llm.temperature', temperature),
+                ('llm.max_tokens', max_tokens),
+                ('llm.timeout', timeout)
+            ]
             
             if openrouter_key and openrouter_key != "***":
-                updates['llm.openrouter_api_key'] = openrouter_key
+                updates.append(('llm.openrouter_api_key', openrouter_key))
             
-            config_manager.update_config(**updates)
-            config_manager.save_to_env_file()
+            self._stage_config(updates)
             
             # Reinitialize LLM manager
             if 'llm_manager' in st.session_state:
                 del st.session_state['llm_manager']
+            self._invalidate_provider_status()
             
-            st.success("✅ LLM configuration saved successfully!")
+            st.success("✅ LLM configuration staged; use Save All Changes to write it.")
             st.rerun()
             
         except Exception as e:
@@ -644,29 +907,27 @@ class ConfigurationTab:
                           github_url, portfolio_url, website_url, summary, skills, job_titles):
         """Save user profile configuration."""
         try:
-            updates = {
-                'user.name': name,
-                'user.email': email,
-                'user.phone': phone,
-                'user.location': location,
-                'user.linkedin_url': linkedin_url,
-                'user.github_url': github_url,
-                'user.portfolio_url': portfolio_url,
-                'user.website_url': website_url,
-                'user.summary': summary,
-                'user.skills': skills,
-                'user.preferred_titles': job_titles
-            }
-            
-            config_manager.update_config(**updates)
+            updates = [
+                ('user.name', name),
+                ('user.email', email),
+                ('user.phone', phone),
+                ('user.location', location),
+                ('user.linkedin_url', linkedin_url),
+                ('user.github_url', github_url),
+                ('user.portfolio_url', portfolio_url),
+                ('user.website_url', website_url),
+                ('user.summary', summary),
+                ('user.skills', skills),
+                ('user.preferred_titles', job_titles)
+            ]
+            
+            self._stage_config(updates)
             
             # Save to preferences file
-            preferences = {k.replace('user.', 'user_'): v for k, v in updates.items()}
+            preferences = {k.replace('user.', 'user_'): v for k, v in updates}
             config_manager.save_user_preferences(preferences)
             
-            config_manager.save_to_env_file()
-            
-            st.success("✅ User profile saved successfully!")
+            st.success("✅ User profile staged; use Save All Changes to write it.")
             st.rerun()
             
         except Exception as e:
@@ -677,23 +938,22 @@ class ConfigurationTab:
                              respect_robots, cache_responses):
         """Save scraping configuration."""
         try:
-            updates = {
-                'scraping.max_jobs_per_batch': max_jobs,
-                'scraping.delay_seconds': delay_seconds,
-                'scraping.rate_limit_per_minute': rate_limit,
-                'scraping.timeout_seconds': timeout_seconds,
-                'scraping.retry_attempts': retry_attempts,
-                'scraping.user_agent': user_agent,
-                'scraping.use_proxy': use_proxy,
-                'scraping.headless': headless_browser,
-                'scraping.respect_robots': respect_robots,
-                'scraping.cache_responses': cache_responses
-            }
-            
-            config_manager.update_config(**updates)
-            config_manager.save_to_env_file()
-            
-            st.success("✅ Scraping configuration saved successfully!")
+            updates = [
+                ('scraping.max_jobs_per_batch', max_jobs),
+                ('scraping.delay_seconds', delay_seconds),
+                ('scraping.rate_limit_per_minute', rate_limit),
+                ('scraping.timeout_seconds', timeout_seconds),
+                ('scraping.retry_attempts', retry_attempts),
+                ('scraping.user_agent', user_agent),
+                ('scraping.use_proxy', use_proxy),
+                ('scraping.headless', headless_browser),
+                ('scraping.respect_robots', respect_robots),
+                ('scraping.cache_responses', cache_responses)
+            ]
+            
+            self._stage_config(updates)
+            
+            st.success("✅ Scraping configuration staged; use Save All Changes to write it.")
             st.rerun()
             
         except Exception as e:
@@ -703,23 +963,22 @@ class ConfigurationTab:
                                    max_contacts, validate_emails, confidence_threshold):
         """Save contact finder configuration."""
         try:
-            updates = {
-                'contact_finder.use_free_methods': use_free_methods,
-                'contact_finder.max_contacts_per_company': max_contacts,
-                'contact_finder.validate_emails': validate_emails,
-                'contact_finder.confidence_threshold': confidence_threshold
-            }
+            updates = [
+                ('contact_finder.use_free_methods', use_free_methods),
+                ('contact_finder.max_contacts_per_company', max_contacts),
+                ('contact_finder.validate_emails', validate_emails),
+                ('contact_finder.confidence_threshold', confidence_threshold)
+            ]
             
             if hunter_key and hunter_key != "***":
-                updates['contact_finder.hunter_io_api_key'] = hunter_key
+                updates.append(('contact_finder.hunter_io_api_key', hunter_key))
             
             if apollo_key and apollo_key != "***":
-                updates['contact_finder.apollo_io_api_key'] = apollo_key
+                updates.append(('contact_finder.apollo_io_api_key', apollo_key))
             
-            config_manager.update_config(**updates)
-            config_manager.save_to_env_file()
+            self._stage_config(updates)
             
-            st.success("✅ Contact finder configuration saved successfully!")
+            st.success("✅ Contact finder configuration staged; use Save All Changes to write it.")
             st.rerun()
             
         except Exception as e:
@@ -728,161 +987,217 @@ class ConfigurationTab:
     def _save_logging_config(self, log_level, log_to_file, max_log_size):
         """Save logging configuration."""
         try:
-            updates = {
-                'log_level': log_level,
-                'log_to_file': log_to_file,
-                'max_log_size_mb': max_log_size
-            }
+            updates = [
+                ('log_level', log_level),
+                ('log_to_file', log_to_file),
+                ('max_log_size_mb', max_log_size)
+            ]
             
-            config_manager.update_config(**updates)
-            config_manager.save_to_env_file()
+            self._stage_config(updates)
             
-            st.success("✅ Logging configuration saved successfully!")
+            st.success("✅ Logging configuration staged; use Save All Changes to write it.")
             st.rerun()
             
         except Exception as e:
             st.error(f"❌ Failed to save logging configuration: {str(e)}")
     
+    def _clear_test_results_if_forced(self):
+        """Drop cached test replies when Force retest is ticked."""
+        if st.session_state.get('force_retest', False):
+            _test_results.clear()
+    
     def _test_llm_provider(self, provider_name: str, llm_manager):
         """Test a specific LLM provider."""
-        try:
-            with st.spinner(f"Testing {provider_name} provider..."):
-                import asyncio
-                
-                # Create a simple test message
-                test_messages = [
-                    {"role": "user", "content": "This is a connection test. Please respond with exactly: 'Connection test successful - LLM is working properly'"}
-                ]
-                
-                # Test the provider
-                response = asyncio.run(llm_manager.generate(
-                    messages=test_messages,
-                    provider=provider_name,
-                    max_tokens=50,
-                    temperature=0.1
-                ))
-                
-                if response.error:
-                    st.error(f"❌ {provider_name.title()} test failed: {response.error}")
-                else:
-                    st.success(f"✅ {provider_name.title()} test successful!")
-                    st.info(f"**Response:** {response.content}")
-                    
-        except Exception as e:
-            st.error(f"❌ Error testing {provider_name}: {str(e)}")
+        self._clear_test_results_if_forced()
+        report = _TestReport()
+        with st.spinner(f"Testing {provider_name} provider..."):
+            _run_async(self._atest_llm_provider(provider_name, llm_manager, report), [(report, st.empty())])
+        report.render(st)
     
     def _test_openrouter_connection(self):
         """Test OpenRouter API connection."""
-        try:
-            with st.spinner("Testing OpenRouter API connection..."):
-                from src.ai_processing import LLMManager
-                import asyncio
-                
-                # Create a temporary LLM manager with current config
-                llm_manager = LLMManager()
-                
-                if 'openrouter' not in llm_manager.get_available_providers():
-                    st.warning("⚠️ OpenRouter not configured. Please add your API key first.")
-                    return
-                
-                # Test with a simple message
-                test_messages = [
-                    {"role": "user", "content": "This is an OpenRouter API connection test. Please respond with exactly: 'OpenRouter API connection successful - service is working properly'"}
-                ]
-                
-                response = asyncio.run(llm_manager.generate(
-                    messages=test_messages,
-                    provider="openrouter",
-                    max_tokens=50,
-                    temperature=0.1
-                ))
-                
-                if response.error:
-                    st.error(f"❌ OpenRouter connection failed: {response.error}")
-                    if "api key" in response.error.lower():
-                        st.info("💡 **Tip:** Make sure your OpenRouter API key is valid and has sufficient credits.")
-                    elif "network" in response.error.lower() or "timeout" in response.error.lower():
-                        st.info("💡 **Tip:** Check your internet connection and try again.")
-                else:
-                    st.success("✅ OpenRouter connection successful!")
-                    st.info(f"**Model:** {response.model}")
-                    st.info(f"**Response:** {response.content}")
-                    if response.usage:
-                        st.info(f"**Tokens used:** {response.usage.get('total_tokens', 'N/A')}")
-                        
-        except Exception as e:
-            st.error(f"❌ Error testing OpenRouter: {str(e)}")
-            st.info("💡 **Troubleshooting:**\n- Verify your API key is correct\n- Check your internet connection\n- Ensure you have OpenRouter credits")
+        self._clear_test_results_if_forced()
+        llm_manager = _get_llm_manager()
+        report = _TestReport()
+        with st.spinner("Testing OpenRouter API connection..."):
+            _run_async(
+                self._atest_openrouter(llm_manager, report, self._available_providers(llm_manager)),
+                [(report, st.empty())]
+            )
+        report.render(st)
     
     def _test_ollama_connection(self):
         """Test Ollama (Local LLM) connection."""
+        self._clear_test_results_if_forced()
+        report = _TestReport()
+        with st.spinner("Testing Ollama connection..."):
+            _run_async(self._atest_ollama(
+                _get_llm_manager(), report, st.session_state.get('ollama_generation_probe', False)
+            ), [(report, st.empty())])
+        report.render(st)
+    
+    def _test_all_providers(self):
+        """Test OpenRouter and Ollama concurrently, each reporting into its own container."""
+        self._clear_test_results_if_forced()
+        llm_manager = _get_llm_manager()
+        reports = (_TestReport(), _TestReport())
+        containers = (st.container(), st.container())
+        with st.spinner("Testing all LLM providers..."):
+            _run_async(self._test_all(
+                llm_manager, reports,
+                self._available_providers(llm_manager),
+                st.session_state.get('ollama_generation_probe', False)
+            ), [(report, container.empty()) for report, container in zip(reports, containers)])
+        
+        for report, container in zip(reports, containers):
+            report.render(container)
+    
+    async def _test_all(self, llm_manager, reports, available, run_generation):
+        """Run the provider connection tests concurrently."""
+        openrouter_report, ollama_report = reports
+        
+        results = await asyncio.gather(
+            self._atest_openrouter(llm_manager, openrouter_report, available),
+            self._atest_ollama(llm_manager, ollama_report, run_generation),
+            return_exceptions=True
+        )
+        
+        for report, result in zip(reports, results):
+            if isinstance(result, Exception):
+                report.error(f"❌ Provider test failed: {str(result)}")
+    
+    async def _astream_test_reply(self, llm_manager, provider_name: str, messages, out):
+        """
+        Stream a short test reply, exposing the partial text as out.streaming.
+        
+        Returns an LLMResponse so callers report success and errors as before.
+        """
+        from src.ai_processing import LLMResponse
+        
         try:
-            with st.spinner("Testing Ollama connection..."):
-                from src.ai_processing import LLMManager
-                import asyncio
-                
-                # Create a temporary LLM manager with current config
-                llm_manager = LLMManager()
-                
-                if 'ollama' not in llm_manager.get_available_providers():
-                    st.warning("⚠️ Ollama not available. Please check the configuration below:")
-                    
-                    # Show detailed troubleshooting
-                    st.info("""
-                    **Ollama Setup Checklist:**
-                    
-                    1. **Install Ollama:** Download from [ollama.ai](https://ollama.ai)
-                    2. **Start Ollama:** Run `ollama serve` in terminal
-                    3. **Pull a model:** Run `ollama pull llama3.1:8b` (or your preferred model)
-                    4. **Verify service:** Check if http://localhost:11434 is accessible
-                    5. **Update config:** Set the correct model name in the configuration above
-                    """)
-                    
-                    # Test basic connectivity
-                    try:
-                        import requests
-                        response = requests.get(self.config.llm.ollama_base_url, timeout=5)
-                        if response.status_code == 200:
-                            st.info("✅ Ollama service is running, but no models may be available.")
-                        else:
-                            st.error(f"❌ Ollama service responded with status {response.status_code}")
-                    except requests.exceptions.ConnectionError:
-                        st.error("❌ Cannot connect to Ollama service. Is it running?")
-                    except Exception as e:
-                        st.error(f"❌ Connection test failed: {str(e)}")
-                    
-                    return
-                
-                # Test with a simple message
-                test_messages = [
-                    {"role": "user", "content": "This is a local LLM connection test. Please respond with exactly: 'Local LLM connection successful - model is working properly'"}
-                ]
+            async for chunk in llm_manager.astream_generate(
+                messages=messages,
+                provider=provider_name,
+                max_tokens=50,
+                temperature=0.1
+            ):
+                out.streaming += chunk
+        except Exception as e:
+            out.streaming = ""
+            return LLMResponse(success=False, error=str(e))
+        
+        content, out.streaming = out.streaming, ""
+        provider = llm_manager.get_provider(provider_name)
+        return LLMResponse(success=True, content=content, model=provider.get_model_name() if provider else "")
+    
+    async def _run_provider_test(self, llm_manager, provider_name: str, messages, out,
+                                 label: str = None, hints=(), fallback_hint: str = None):
+        """
+        Send a test prompt to one provider and report the outcome to out.
+        
+        On failure, the first hint whose keywords appear in the error is shown,
+        otherwise fallback_hint (if any). Successful replies are reused for
+        TEST_RESULT_TTL_SECONDS unless Force retest is ticked.
+        """
+        label = label or provider_name.title()
+        
+        # Reuse a recent successful reply; nothing about connectivity has changed
+        cache_key = _test_cache_key(llm_manager, provider_name, messages)
+        cached = _test_results.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            response = cached[1]
+            out.info(f"ℹ️ Showing a result from the last {TEST_RESULT_TTL_SECONDS} seconds. Tick **Force retest** to run it again.")
+        else:
+            response = await self._astream_test_reply(llm_manager, provider_name, messages, out)
+            if not response.error:
+                _test_results[cache_key] = (time.monotonic() + TEST_RESULT_TTL_SECONDS, response)
+        
+        if response.error:
+            out.error(f"❌ {label} connection failed: {response.error}")
+            error = response.error.lower()
+            hint = next((tip for keywords, tip in hints if any(k in error for k in keywords)), fallback_hint)
+            if hint:
+                out.info(f"💡 **Tip:** {hint}")
+        else:
+            out.success(f"✅ {label} connection successful!")
+            out.info(f"**Model:** {response.model}")
+            out.info(f"**Response:** {response.content}")
+            if response.usage:
+                out.info(f"**Tokens used:** {response.usage.get('total_tokens', 'N/A')}")
+    
+    async def _atest_llm_provider(self, provider_name: str, llm_manager, out):
+        """Test a specific LLM provider, writing results to out."""
+        try:
+            await self._run_provider_test(llm_manager, provider_name, _GENERIC_TEST_MSGS, out)
+        except Exception as e:
+            out.error(f"❌ Error testing {provider_name}: {str(e)}")
+    
+    async def _atest_openrouter(self, llm_manager, out, available):
+        """Test OpenRouter API connection, writing results to out."""
+        try:
+            if 'openrouter' not in available:
+                out.warning("⚠️ OpenRouter not configured. Please add your API key first.")
+                return
+            
+            await self._run_provider_test(
+                llm_manager, "openrouter", _OPENROUTER_TEST_MSGS, out,
+                label="OpenRouter", hints=_OPENROUTER_TEST_HINTS
+            )
+            
+        except Exception as e:
+            out.error(f"❌ Error testing OpenRouter: {str(e)}")
+            out.info("💡 **Troubleshooting:**\n- Verify your API key is correct\n- Check your internet connection\n- Ensure you have OpenRouter credits")
+    
+    async def _atest_ollama(self, llm_manager, out, run_generation: bool = False):
+        """
+        Test Ollama (Local LLM) connection, writing results to out.
+        
+        Reachability and the configured model are checked with a quick /api/tags
+        request; the slow generation test only runs when run_generation is set.
+        """
+        try:
+            # Phase 1: cheap reachability and model check via /api/tags
+            try:
+                models = await llm_manager.alist_models("ollama")
+            except Exception as e:
+                if isinstance(e, OSError):
+                    out.error("❌ Cannot connect to Ollama service. Is it running?")
+                else:
+                    out.error(f"❌ Connection test failed: {str(e)}")
                 
-                response = asyncio.run(llm_manager.generate(
-                    messages=test_messages,
-                    provider="ollama",
-                    max_tokens=50,
-                    temperature=0.1
-                ))
+                # Show detailed troubleshooting
+                out.info("""
+                **Ollama Setup Checklist:**
                 
-                if response.error:
-                    st.error(f"❌ Ollama connection failed: {response.error}")
-                    
-                    # Provide specific troubleshooting based on error
-                    if "connection" in response.error.lower():
-                        st.info("💡 **Tip:** Make sure Ollama is running with `ollama serve`")
-                    elif "model" in response.error.lower():
-                        st.info(f"💡 **Tip:** Pull the model with `ollama pull {self.config.llm.local_llm_model}`")
-                    else:
-                        st.info("💡 **Tip:** Check Ollama logs for more details")
-                else:
-                    st.success("✅ Ollama connection successful!")
-                    st.info(f"**Model:** {response.model}")
-                    st.info(f"**Response:** {response.content}")
-                    
+                1. **Install Ollama:** Download from [ollama.ai](https://ollama.ai)
+                2. **Start Ollama:** Run `ollama serve` in terminal
+                3. **Pull a model:** Run `ollama pull llama3.1:8b` (or your preferred model)
+                4. **Verify service:** Check if http://localhost:11434 is accessible
+                5. **Update config:** Set the correct model name in the configuration above
+                """)
+                return
+            
+            model_name = self._llm.local_llm_model
+            if model_name not in models and f"{model_name}:latest" not in models:
+                out.warning(f"⚠️ Ollama is running, but model `{model_name}` is not available.")
+                out.info(f"💡 **Tip:** Pull the model with `ollama pull {model_name}`")
+                return
+            
+            out.success(f"✅ Ollama is running and `{model_name}` is available.")
+            
+            # Phase 2: generation round-trip, only when asked for
+            if not run_generation:
+                return
+            
+            await self._run_provider_test(
+                llm_manager, "ollama", _OLLAMA_TEST_MSGS, out,
+                hints=_OLLAMA_TEST_HINTS + ((("model",), f"Pull the model with `ollama pull {model_name}`"),),
+                fallback_hint="Check Ollama logs for more details"
+            )
+            
         except Exception as e:
-            st.error(f"❌ Error testing Ollama: {str(e)}")
-            st.info("""
+            out.error(f"❌ Error testing Ollama: {str(e)}")
+            out.info("""
             💡 **Troubleshooting Steps:**
             1. Install Ollama from https://ollama.ai
             2. Run `ollama serve` in terminal
@@ -5,20 +5,107 @@ This module provides the main dashboard interface with metrics, recent activity,
 job management, and quick actions.
 """
 
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from pathlib import Path
-import sys
-
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
 
+# The project root is put on sys.path by the entry point (src/ui/app.py)
 from src.ui.utils.styling import create_metric_card, create_info_card, create_status_badge
 
+JOBS_PAGE_SIZE = 50
+
+# Job table columns, with display labels supplied through column_config
+JOB_TABLE_COLUMNS = ['title', 'company', 'location', 'status', 'created_at']
+JOB_TABLE_COLUMN_CONFIG = {
+    col: st.column_config.Column(col.replace('_', ' ').title())
+    for col in JOB_TABLE_COLUMNS
+}
+
+# Display labels for the LinkedIn scraping filter codes
+EXPERIENCE_LEVEL_LABELS = {
+    "": "Any Level",
+    "1": "Internship",
+    "2": "Entry Level",
+    "3": "Associate",
+    "4": "Mid-Senior Level",
+    "5": "Director",
+    "6": "Executive"
+}
+JOB_TYPE_LABELS = {
+    "": "All Types",
+    "F": "Full-time",
+    "P": "Part-time",
+    "C": "Contract",
+    "T": "Temporary",
+    "I": "Internship"
+}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_stats(_db, db_path):
+    """Database statistics, shared by the metrics and charts; keyed on the database path."""
+    return _db.get_stats()
+
+# The job count and job pages expire together, so "Showing a-b of N" and the
+# page bounds come from the same snapshot of the jobs table
+JOBS_CACHE_TTL = 30
+
+@st.cache_data(ttl=JOBS_CACHE_TTL, show_spinner=False)
+def _count_jobs(_db, db_path, filters):
+    """Number of jobs matching the filters, recounted only when the filters change."""
+    return _db.count_jobs_filtered(filters)
+
+@st.cache_data(ttl=JOBS_CACHE_TTL, show_spinner=False)
+def _filtered_jobs(_db, db_path, filter_key, page, page_size):
+    """One page of jobs matching the filters, keyed on a frozenset of filter items."""
+    return _db.get_jobs_filtered(dict(filter_key), limit=page_size, offset=(page - 1) * page_size)
+
+# The overview charts are informational only, so they render without hover or toolbar
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _build_jobs_pie(counts):
+    """Jobs-by-status pie chart for a tuple of (status, count) pairs."""
+    # Plotly is imported on first chart build, keeping it off the tab's import path
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+    
+    fig = go.Figure(go.Pie(
+        labels=[status for status, _ in counts],
+        values=[count for _, count in counts],
+        marker_colors=qualitative.Set3,
+        hoverinfo='skip'
+    ))
+    fig.update_layout(title="Jobs by Status", height=300)
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _build_applications_bar(counts):
+    """Applications-by-status bar chart for a tuple of (status, count) pairs."""
+    import plotly.graph_objects as go
+    
+    values = [count for _, count in counts]
+    fig = go.Figure(go.Bar(
+        x=[status for status, _ in counts],
+        y=values,
+        marker=dict(color=values, colorscale="Viridis"),
+        hoverinfo='skip'
+    ))
+    fig.update_layout(title="Applications by Status", height=300)
+    return fig
+
+@st.cache_resource
+def _get_scrape_executor():
+    """Worker threads for job scraping, shared for the life of the process."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="job-scrape")
+
+def _clear_data_caches():
+    """Drop cached statistics, counts and job pages after the job data changes."""
+    _fetch_stats.clear()
+    _count_jobs.clear()
+    _filtered_jobs.clear()
+
 class DashboardTab:
     """Dashboard tab component for the main application interface."""
     
@@ -34,14 +121,17 @@ class DashboardTab:
         # System health check
         self._render_system_health()
         
+        # Statistics are fetched once and shared by the metrics and charts
+        stats = self._load_stats()
+        
         # Key metrics
-        self._render_key_metrics()
+        self._render_key_metrics(stats)
         
         # Recent activity and charts
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            self._render_activity_charts()
+            self._render_activity_charts(stats)
         
         with col2:
             self._render_recent_activity()
@@ -52,50 +142,46 @@ class DashboardTab:
         # Quick actions
         self._render_quick_actions()
     
+    def _load_stats(self):
+        """Load (cached) database statistics; returns None if they are unavailable."""
+        if not self.db:
+            return None
+        
+        try:
+            return _fetch_stats(self.db, str(self.db.db_path))
+        except Exception as e:
+            st.error(f"Error loading statistics: {str(e)}")
+            return None
+    
     def _render_system_health(self):
         """Render system health status."""
         st.markdown("#### 🏥 System Health")
         
-        col1, col2, col3, col4 = st.columns(4)
+        db_ok = bool(self.db) and st.session_state.get('db_status') == 'connected'
+        resume_ok = bool(st.session_state.get('resume_handler'))
         
-        # Database status
-        with col1:
-            if self.db and st.session_state.get('db_status') == 'connected':
-                status_html = create_metric_card("✅", "Database", "healthy")
+        llm_manager = st.session_state.get('llm_manager')
+        if llm_manager:
+            providers = llm_manager.get_available_providers()
+            if providers:
+                llm_card = create_metric_card(f"{len(providers)}", "LLM Providers", "healthy")
             else:
-                status_html = create_metric_card("❌", "Database", "error")
-            st.markdown(status_html, unsafe_allow_html=True)
-        
-        # LLM status
-        with col2:
-            llm_manager = st.session_state.get('llm_manager')
-            if llm_manager:
-                providers = llm_manager.get_available_providers()
-                if providers:
-                    status_html = create_metric_card(f"{len(providers)}", "LLM Providers", "healthy")
-                else:
-                    status_html = create_metric_card("0", "LLM Providers", "error")
-            else:
-                status_html = create_metric_card("❌", "LLM Providers", "error")
-            st.markdown(status_html, unsafe_allow_html=True)
-        
-        # Resume status
-        with col3:
-            if st.session_state.get('resume_handler'):
-                status_html = create_metric_card("✅", "Resume", "healthy")
-            else:
-                status_html = create_metric_card("❌", "Resume", "error")
-            st.markdown(status_html, unsafe_allow_html=True)
-        
-        # Configuration status
-        with col4:
-            if self.config:
-                status_html = create_metric_card("✅", "Config", "healthy")
-            else:
-                status_html = create_metric_card("❌", "Config", "error")
-            st.markdown(status_html, unsafe_allow_html=True)
+                llm_card = create_metric_card("0", "LLM Providers", "error")
+        else:
+            llm_card = create_metric_card("❌", "LLM Providers", "error")
+        
+        # All four status cards in a single markdown element
+        cards_html = (
+            '<div class="metric-row">'
+            + create_metric_card("✅" if db_ok else "❌", "Database", "healthy" if db_ok else "error")
+            + llm_card
+            + create_metric_card("✅" if resume_ok else "❌", "Resume", "healthy" if resume_ok else "error")
+            + create_metric_card("✅" if self.config else "❌", "Config", "healthy" if self.config else "error")
+            + '</div>'
+        )
+        st.markdown(cards_html, unsafe_allow_html=True)
     
-    def _render_key_metrics(self):
+    def _render_key_metrics(self, stats):
         """Render key application metrics."""
         st.markdown("#### 📈 Key Metrics")
         
@@ -103,86 +189,67 @@ class DashboardTab:
             st.warning("Database not available. Cannot display metrics.")
             return
         
+        if stats is None:
+            return
+        
+        if not stats.get('jobs_by_status') and not stats.get('applications_by_status'):
+            st.info("No jobs or applications yet.")
+            return
+        
         try:
-            stats = self.db.get_stats()
-            
-            col1, col2, col3, col4, col5 = st.columns(5)
-            
-            # Total jobs
-            with col1:
-                job_count = sum(stats.get('jobs_by_status', {}).values())
-                metric_html = create_metric_card(str(job_count), "Total Jobs")
-                st.markdown(metric_html, unsafe_allow_html=True)
-            
-            # Applications
-            with col2:
-                app_count = sum(stats.get('applications_by_status', {}).values())
-                metric_html = create_metric_card(str(app_count), "Applications")
-                st.markdown(metric_html, unsafe_allow_html=True)
-            
-            # Success rate
-            with col3:
-                if app_count > 0:
-                    success_count = stats.get('applications_by_status', {}).get('sent', 0)
-                    success_rate = round((success_count / app_count) * 100, 1)
-                    metric_html = create_metric_card(f"{success_rate}%", "Success Rate")
-                else:
-                    metric_html = create_metric_card("0%", "Success Rate")
-                st.markdown(metric_html, unsafe_allow_html=True)
-            
-            # Pending jobs
-            with col4:
-                pending_count = stats.get('jobs_by_status', {}).get('pending', 0)
-                metric_html = create_metric_card(str(pending_count), "Pending Jobs")
-                st.markdown(metric_html, unsafe_allow_html=True)
-            
-            # Active applications
-            with col5:
-                active_count = stats.get('applications_by_status', {}).get('draft', 0)
-                metric_html = create_metric_card(str(active_count), "Drafts")
-                st.markdown(metric_html, unsafe_allow_html=True)
+            jobs_by_status = stats.get('jobs_by_status') or {}
+            apps_by_status = stats.get('applications_by_status') or {}
+            job_count = sum(jobs_by_status.values())
+            app_count = sum(apps_by_status.values())
+            success_rate = round((apps_by_status.get('sent', 0) / app_count) * 100, 1) if app_count else 0
+            pending_count = jobs_by_status.get('pending', 0)
+            active_count = apps_by_status.get('draft', 0)
+            
+            cards_html = (
+                '<div class="metric-row">'
+                + create_metric_card(str(job_count), "Total Jobs")
+                + create_metric_card(str(app_count), "Applications")
+                + create_metric_card(f"{success_rate}%", "Success Rate")
+                + create_metric_card(str(pending_count), "Pending Jobs")
+                + create_metric_card(str(active_count), "Drafts")
+                + '</div>'
+            )
+            st.markdown(cards_html, unsafe_allow_html=True)
                 
         except Exception as e:
             st.error(f"Error loading metrics: {str(e)}")
     
-    def _render_activity_charts(self):
+    def _render_activity_charts(self, stats):
         """Render activity charts and visualizations."""
         st.markdown("#### 📊 Activity Overview")
         
+        # Charts can be switched off to skip building and sending the figures
+        if not st.toggle("Show charts", value=True, key="show_charts"):
+            return
+        
         if not self.db:
             st.info("Database not available for charts.")
             return
         
+        if stats is None:
+            return
+        
+        if not stats.get('jobs_by_status') and not stats.get('applications_by_status'):
+            st.info("No data available for charts. Start by adding some jobs!")
+            return
+        
         try:
-            stats = self.db.get_stats()
-            
             # Jobs by status chart
             jobs_by_status = stats.get('jobs_by_status', {})
             if jobs_by_status:
-                fig_jobs = px.pie(
-                    values=list(jobs_by_status.values()),
-                    names=list(jobs_by_status.keys()),
-                    title="Jobs by Status",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                fig_jobs.update_layout(height=300)
-                st.plotly_chart(fig_jobs, width="stretch")
+                fig_jobs = _build_jobs_pie(tuple(sorted(jobs_by_status.items(), key=str)))
+                st.plotly_chart(fig_jobs, width="stretch", theme=None, config=STATIC_CHART_CONFIG)
             
             # Applications by status chart
             apps_by_status = stats.get('applications_by_status', {})
             if apps_by_status:
-                fig_apps = px.bar(
-                    x=list(apps_by_status.keys()),
-                    y=list(apps_by_status.values()),
-                    title="Applications by Status",
-                    color=list(apps_by_status.values()),
-                    color_continuous_scale="viridis"
-                )
-                fig_apps.update_layout(height=300)
-                st.plotly_chart(fig_apps, width="stretch")
-            
-            if not jobs_by_status and not apps_by_status:
-                st.info("No data available for charts. Start by adding some jobs!")
+                fig_apps = _build_applications_bar(tuple(sorted(apps_by_status.items(), key=str)))
+                st.plotly_chart(fig_apps, width="stretch", theme=None, config=STATIC_CHART_CONFIG)
                 
         except Exception as e:
             st.error(f"Error loading charts: {str(e)}")
@@ -197,53 +264,70 @@ class DashboardTab:
         
         try:
             # Get recent jobs (last 10)
-            recent_jobs = self.db.get_recent_jobs(limit=10)
+            recent_jobs = self.db.get_recent_jobs(limit=10, preview_chars=200)
             
             if recent_jobs:
-                for job in recent_jobs:
-                    with st.expander(f"{job.get('title', 'Unknown')} - {job.get('company', 'Unknown')}"):
-                        st.write(f"**Status:** {job.get('status', 'Unknown')}")
-                        st.write(f"**Location:** {job.get('location', 'Unknown')}")
-                        st.write(f"**Added:** {job.get('created_at', 'Unknown')}")
+                for i, job in enumerate(recent_jobs):
+                    # One markdown element per job; only the newest starts expanded
+                    with st.expander(f"{job.get('title', 'Unknown')} - {job.get('company', 'Unknown')}", expanded=i == 0):
+                        details = (
+                            f"**Status:** {job.get('status') or 'Unknown'}  \n"
+                            f"**Location:** {job.get('location') or 'Unknown'}  \n"
+                            f"**Added:** {job.get('scraped_at') or 'Unknown'}"
+                        )
+                        
+                        preview = job.get('description_preview')
+                        if preview:
+                            short = preview[:200] + ("..." if len(preview) > 200 else "")
+                            details += f"\n\n**Description:**\n\n{short}"
                         
-                        if job.get('description'):
-                            st.write("**Description:**")
-                            st.write(job['description'][:200] + "..." if len(job['description']) > 200 else job['description'])
+                        st.markdown(details)
             else:
                 st.info("No recent activity found.")
                 
         except Exception as e:
             st.error(f"Error loading recent activity: {str(e)}")
     
+    @st.fragment
     def _render_job_management(self):
-        """Render job management interface."""
+        """
+        Render job management interface.
+        
+        A fragment, so applying the filters reruns only the job table rather
+        than the whole dashboard.
+        """
         st.markdown("#### 💼 Job Management")
         
         col1, col2 = st.columns([3, 1])
         
         with col1:
-            # Job search and filtering
-            search_term = st.text_input("🔍 Search jobs", placeholder="Search by title, company, or keywords...")
-            
-            col_filter1, col_filter2, col_filter3 = st.columns(3)
-            
-            with col_filter1:
-                status_filter = st.selectbox("Status", ["All", "pending", "approved", "rejected", "applied"])
-            
-            with col_filter2:
-                location_filter = st.text_input("Location", placeholder="Any location")
-            
-            with col_filter3:
-                company_filter = st.text_input("Company", placeholder="Any company")
+            # Job search and filtering; filters apply on submit rather than on every keystroke
+            with st.form("jobs_filter", clear_on_submit=False, border=False):
+                search_term = st.text_input("🔍 Search jobs", placeholder="Search by title, company, or keywords...", key="jobs_search")
+                
+                col_filter1, col_filter2, col_filter3 = st.columns(3)
+                
+                with col_filter1:
+                    status_filter = st.selectbox("Status", ["All", "pending", "approved", "rejected", "applied"], key="jobs_status_filter")
+                
+                with col_filter2:
+                    location_filter = st.text_input("Location", placeholder="Any location", key="jobs_location_filter")
+                
+                with col_filter3:
+                    company_filter = st.text_input("Company", placeholder="Any company", key="jobs_company_filter")
+                
+                st.form_submit_button("Apply Filters")
         
         with col2:
             st.markdown("**Quick Actions**")
+            # Both actions change what is shown outside this fragment, so rerun the app
             if st.button("🔄 Refresh Data", width="stretch"):
-                st.session_state.refresh_data = True
+                _clear_data_caches()
                 st.rerun()
             
             if st.button("➕ Add Job", width="stretch"):
                 st.session_state.show_add_job = True
+                st.rerun()
         
         # Display jobs table
         if self.db:
@@ -259,25 +343,31 @@ class DashboardTab:
                 if search_term:
                     filters['search'] = search_term
                 
-                jobs = self.db.get_jobs_filtered(filters)
+                total = _count_jobs(self.db, str(self.db.db_path), filters)
                 
-                if jobs:
-                    # Convert to DataFrame for better display
-                    df = pd.DataFrame(jobs)
+                if total:
+                    # Only the selected page is fetched from the database
+                    page_count = (total + JOBS_PAGE_SIZE - 1) // JOBS_PAGE_SIZE
+                    if st.session_state.get('jobs_page', 1) > page_count:
+                        st.session_state['jobs_page'] = page_count
+                    page = st.number_input("Page", min_value=1, max_value=page_count, key="jobs_page") if page_count > 1 else 1
+                    
+                    offset = (page - 1) * JOBS_PAGE_SIZE
+                    jobs = _filtered_jobs(self.db, str(self.db.db_path), frozenset(filters.items()), page, JOBS_PAGE_SIZE)
+                    st.caption(f"Showing {offset + 1}-{offset + len(jobs)} of {total} jobs")
                     
-                    # Select and rename columns for display
-                    display_columns = ['title', 'company', 'location', 'status', 'created_at']
-                    available_columns = [col for col in display_columns if col in df.columns]
+                    # Build the displayed columns directly; no DataFrame needed
+                    available_columns = [col for col in JOB_TABLE_COLUMNS if jobs and col in jobs[0]]
                     
                     if available_columns:
-                        df_display = df[available_columns].copy()
-                        df_display.columns = [col.replace('_', ' ').title() for col in available_columns]
+                        table = {col: [job.get(col) for job in jobs] for col in available_columns}
                         
                         # Display the table
                         st.dataframe(
-                            df_display,
+                            table,
                             width="stretch",
-                            hide_index=True
+                            hide_index=True,
+                            column_config=JOB_TABLE_COLUMN_CONFIG
                         )
                     else:
                         st.write("Jobs found but no displayable columns available.")
@@ -311,18 +401,29 @@ class DashboardTab:
             if st.button("📊 Export Report", width="stretch"):
                 st.info("🚧 Report export functionality coming soon!")
         
-        # Add job modal (if triggered)
-        if st.session_state.get('show_add_job'):
+        # Progress of a scrape running in the background, then its results once finished
+        if st.session_state.get('job_scrape'):
+            self._render_scraping_progress()
+        
+        results = st.session_state.pop('job_scrape_results', None)
+        if results:
+            self._display_scraping_results(results)
+        
+        error = st.session_state.pop('job_scrape_error', None)
+        if error:
+            st.error(f"❌ Error during job scraping: {error}")
+            st.info("Please check your network connection and try again.")
+        
+        # Dialogs rerun on their own once opened, so the trigger flags are consumed here
+        if st.session_state.pop('show_add_job', False):
             self._render_add_job_modal()
         
-        # Job scraping modal (if triggered)
-        if st.session_state.get('show_job_scraping'):
+        if st.session_state.pop('show_job_scraping', False):
             self._show_job_scraping_modal()
     
+    @st.dialog("➕ Add New Job", width="large")
     def _render_add_job_modal(self):
         """Render add job modal dialog."""
-        st.markdown("#### ➕ Add New Job")
-        
         with st.form("add_job_form"):
             col1, col2 = st.columns(2)
             
@@ -364,8 +465,8 @@ class DashboardTab:
                         
                         if self.db:
                             job_id = self.db.add_job(job_data)
+                            _clear_data_caches()
                             st.success(f"✅ Job added successfully! ID: {job_id}")
-                            st.session_state.show_add_job = False
                             st.rerun()
                         else:
                             st.error("Database not available. Cannot add job.")
@@ -375,13 +476,11 @@ class DashboardTab:
                     st.error("Please fill in required fields (Title and Company)")
             
             if cancelled:
-                st.session_state.show_add_job = False
                 st.rerun()
     
+    @st.dialog("🔍 LinkedIn Job Scraping", width="large")
     def _show_job_scraping_modal(self):
         """Show job scraping modal dialog."""
-        st.markdown("#### 🔍 LinkedIn Job Scraping")
-        
         with st.form("job_scraping_form"):
             col1, col2 = st.columns(2)
             
@@ -407,30 +506,15 @@ class DashboardTab:
             with col2:
                 experience_level = st.selectbox(
                     "Experience Level",
-                    ["", "1", "2", "3", "4", "5", "6"],
-                    format_func=lambda x: {
-                        "": "Any Level",
-                        "1": "Internship", 
-                        "2": "Entry Level",
-                        "3": "Associate",
-                        "4": "Mid-Senior Level",
-                        "5": "Director",
-                        "6": "Executive"
-                    }.get(x, x),
+                    list(EXPERIENCE_LEVEL_LABELS),
+                    format_func=EXPERIENCE_LEVEL_LABELS.__getitem__,
                     help="Filter by experience level"
                 )
                 
                 job_type = st.selectbox(
                     "Job Type",
-                    ["", "F", "P", "C", "T", "I"],
-                    format_func=lambda x: {
-                        "": "All Types",
-                        "F": "Full-time",
-                        "P": "Part-time", 
-                        "C": "Contract",
-                        "T": "Temporary",
-                        "I": "Internship"
-                    }.get(x, x),
+                    list(JOB_TYPE_LABELS),
+                    format_func=JOB_TYPE_LABELS.__getitem__,
                     help="Filter by employment type"
                 )
                 
@@ -462,11 +546,15 @@ class DashboardTab:
                     )
             
             if cancelled:
-                st.session_state.show_job_scraping = False
                 st.rerun()
     
     def _execute_job_scraping(self, keywords, location, experience_level, job_type, max_jobs, auto_save):
-        """Execute the job scraping process."""
+        """
+        Start the job scraping process on a worker thread.
+        
+        The scraper reports progress through a queue that
+        _render_scraping_progress polls, so the app stays responsive.
+        """
         try:
             # Import the LinkedIn scraper
             from src.scrapers.linkedin_scraper import LinkedInRSScraper
@@ -477,59 +565,86 @@ class DashboardTab:
             
             # Initialize the scraper
             scraper = LinkedInRSScraper(self.db)
+            progress = queue.Queue()
             
-            # Start scraping with progress indication
-            with st.spinner(f"🔍 Scraping LinkedIn jobs for: {keywords}..."):
-                
-                # Create progress container
-                progress_container = st.container()
-                with progress_container:
-                    st.info(f"🔍 Searching for jobs: **{keywords}**")
-                    if location:
-                        st.info(f"📍 Location: **{location}**")
-                    st.info(f"📊 Max jobs: **{max_jobs}**")
-                
-                # Execute scraping
+            def run_scrape():
                 if auto_save:
-                    results = scraper.scrape_and_save_jobs(
+                    return scraper.scrape_and_save_jobs(
                         keywords=keywords,
                         location=location,
                         experience_level=experience_level,
                         job_type=job_type,
-                        max_jobs=max_jobs
-                    )
-                else:
-                    jobs = scraper.scrape_jobs(
-                        keywords=keywords,
-                        location=location,
-                        experience_level=experience_level,
-                        job_type=job_type,
-                        max_jobs=max_jobs
+                        max_jobs=max_jobs,
+                        progress_callback=progress.put
                     )
-                    results = {
-                        'scraped_count': len(jobs),
-                        'saved_count': 0,
-                        'duration_seconds': 0,
-                        'keywords': keywords,
-                        'location': location
-                    }
-                
-                # Display results
-                self._display_scraping_results(results)
                 
-                # Clear the scraping modal state
-                if 'show_job_scraping' in st.session_state:
-                    del st.session_state['show_job_scraping']
-                
-                # Refresh the dashboard
-                st.rerun()
+                jobs = scraper.scrape_jobs(
+                    keywords=keywords,
+                    location=location,
+                    experience_level=experience_level,
+                    job_type=job_type,
+                    max_jobs=max_jobs,
+                    progress_callback=progress.put
+                )
+                return {
+                    'scraped_count': len(jobs),
+                    'saved_count': 0,
+                    'duration_seconds': 0,
+                    'keywords': keywords,
+                    'location': location
+                }
+            
+            st.session_state.job_scrape = {
+                'future': _get_scrape_executor().submit(run_scrape),
+                'progress': progress,
+                'processed': 0,
+                'keywords': keywords,
+                'location': location,
+                'max_jobs': max_jobs
+            }
+            
+            # Close the dialog; the dashboard picks up the running scrape
+            st.rerun()
                 
         except ImportError as e:
             st.error(f"❌ Error importing scraper: {str(e)}")
             st.info("Make sure all dependencies are installed.")
         except Exception as e:
-            st.error(f"❌ Error during job scraping: {str(e)}")
-            st.info("Please check your network connection and try again.")
+            st.error(f"❌ Error starting job scraping: {str(e)}")
+    
+    @st.fragment(run_every=1)
+    def _render_scraping_progress(self):
+        """Poll the background scrape, showing its progress until it finishes."""
+        task = st.session_state.get('job_scrape')
+        if not task:
+            return
+        
+        # Only the latest progress count matters
+        try:
+            while True:
+                task['processed'] = task['progress'].get_nowait()
+        except queue.Empty:
+            pass
+        
+        future = task['future']
+        if not future.done():
+            where = f" in **{task['location']}**" if task['location'] else ""
+            st.progress(
+                min(task['processed'] / task['max_jobs'], 1.0),
+                text=f"🔍 Scraping LinkedIn jobs for **{task['keywords']}**{where}: "
+                     f"{task['processed']}/{task['max_jobs']} processed"
+            )
+            return
+        
+        del st.session_state['job_scrape']
+        try:
+            st.session_state.job_scrape_results = future.result()
+            # Refresh the dashboard with the new jobs
+            _clear_data_caches()
+        except Exception as e:
+            # Shown by the app rerun; this fragment's next tick would clear it
+            st.session_state.job_scrape_error = str(e)
+        st.rerun()
     
     def _display_scraping_results(self, results):
         """Display job scraping results."""
@@ -8,15 +8,136 @@ before sending them out to potential employers.
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from html import escape
 from typing import List, Dict, Optional, Any
 import asyncio
+import csv
+import io
 import json
+import zipfile
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from email.utils import formataddr
 
-from ...email_composer import EmailGenerator, GeneratedEmail, EmailTemplateManager
+from ...email_composer import EmailGenerator, GeneratedEmail, EmailTemplateManager, EmailGenerationRequest
 from ...contact_finder import Contact
 from ...ai_processing.resume_customizer import CustomizationResult
 from ...config.database import DatabaseManager
 from ..utils.styling import apply_custom_css
+from ..utils.background import get_event_loop
+
+EMAIL_QUEUE_PAGE_SIZE = 50
+
+# Exported columns; the first five are the message itself, the rest are metadata
+EXPORT_COLUMNS = ("id", "contact_email", "contact_name", "subject", "body",
+                  "job_title", "company", "template_used", "personalization_score", "created_at")
+
+_EXPORT_EMAILS_SQL = """
+SELECT ge.id, ge.contact_email, ge.contact_name, ge.subject, ge.body,
+       j.title AS job_title, j.company, ge.template_used, ge.personalization_score, ge.created_at
+FROM generated_emails ge
+JOIN jobs j ON ge.job_id = j.id
+WHERE ge.ready_for_export = 1
+ORDER BY ge.created_at DESC
+"""
+
+# Newlines in an (already escaped) email body become HTML line breaks
+_BR_TABLE = str.maketrans({'\n': '<br>'})
+
+# Listing columns only; the body is fetched per email by _fetch_email_body.
+# One fixed statement for every filter combination, so SQLite's statement cache reuses it.
+# total_count is the number of matching rows before LIMIT, so a page needs no separate count.
+# Export readiness lives only in ready_for_export; the listed status shows it as "ready".
+_FILTERED_EMAILS_SQL = """
+SELECT ge.id, ge.job_id, ge.contact_email, ge.contact_name, ge.subject,
+       substr(ge.subject, 1, 50) || CASE WHEN length(ge.subject) > 50 THEN '...' ELSE '' END AS subject_short,
+       ge.template_used, ge.personalization_score,
+       CASE WHEN ge.ready_for_export = 1 THEN 'ready' ELSE ge.status END AS status,
+       ge.created_at, ge.updated_at,
+       j.title as job_title, j.company, COUNT(*) OVER () AS total_count
+FROM generated_emails ge
+JOIN jobs j ON ge.job_id = j.id
+WHERE (:company IS NULL OR j.company = :company)
+  AND (:template IS NULL OR ge.template_used = :template)
+  AND (:min_score <= 0 OR ge.personalization_score >= :min_score)
+ORDER BY ge.created_at DESC
+LIMIT :limit OFFSET :offset
+"""
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_emails(_db, db_path, company_filter, template_filter, min_score, limit=-1, offset=0):
+    """Generated emails matching the filters, newest first; reused across reruns."""
+    with _db.connection() as conn:
+        cursor = conn.execute(_FILTERED_EMAILS_SQL, {
+            "company": None if company_filter == "All" else company_filter,
+            "template": None if template_filter == "All" else template_filter,
+            "min_score": min_score,
+            "limit": limit,
+            "offset": offset
+        })
+        # Pooled connections return sqlite3.Row; cache_data needs plain (picklable) dicts
+        return [dict(row) for row in cursor.fetchall()]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_companies(_db, db_path):
+    """Companies that have generated emails, for the queue filter; reused across reruns."""
+    with _db.connection() as conn:
+        cursor = conn.execute("""
+        SELECT DISTINCT j.company
+        FROM generated_emails ge
+        JOIN jobs j ON ge.job_id = j.id
+        ORDER BY j.company
+        """)
+        return [row[0] for row in cursor.fetchall()]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_export_ready_emails(_db, db_path):
+    """Emails marked ready for export, newest first; reused across reruns."""
+    with _db.connection() as conn:
+        cursor = conn.execute("""
+        SELECT ge.*, j.title as job_title, j.company
+        FROM generated_emails ge
+        JOIN jobs j ON ge.job_id = j.id
+        WHERE ge.ready_for_export = 1
+        ORDER BY ge.created_at DESC
+        """)
+        return [dict(row) for row in cursor.fetchall()]
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _email_html(email_id, version, _subject: str, _body: str) -> str:
+    """
+    HTML preview of an email with its text escaped.
+    
+    Keyed on the email id and its last-modified timestamp, so the subject
+    and body are not hashed and an edit produces a fresh entry.
+    """
+    return f"""
+        <div style="margin-bottom: 20px;">
+            <strong>Subject:</strong> {escape(_subject)}
+        </div>
+        <div>
+            {escape(_body).translate(_BR_TABLE)}
+        </div>
+        """
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_email_body(_db, db_path, email_id):
+    """Body text of one generated email; reused across reruns."""
+    with _db.connection() as conn:
+        row = conn.execute("SELECT body FROM generated_emails WHERE id = ?", (email_id,)).fetchone()
+        return row['body'] if row else ""
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _email_labels(signature, _emails):
+    """Selector labels for an email list, keyed on its signature so the rows aren't hashed."""
+    return [f"{email['company']} - {email['job_title']} ({email['contact_name']})" for email in _emails]
+
+def _clear_email_caches():
+    """Drop cached email queries after the generated emails change."""
+    _fetch_emails.clear()
+    _fetch_companies.clear()
+    _fetch_email_body.clear()
+    _fetch_export_ready_emails.clear()
 
 class EmailPreviewInterface:
     """Email preview and editing interface component."""
@@ -34,7 +155,8 @@ class EmailPreviewInterface:
         # Apply custom styling
         apply_custom_css()
         
-        # Create tabs for different views
+        # Create tabs for different views; each tab is a fragment, so its
+        # widgets rerun only that tab
         tab1, tab2, tab3, tab4 = st.tabs([
             "📋 Email Queue",
             "✏️ Edit Emails", 
@@ -54,6 +176,7 @@ class EmailPreviewInterface:
         with tab4:
             self._render_export_ready_tab()
     
+    @st.fragment
     def _render_email_queue_tab(self):
         """Render the email queue management tab."""
         st.subheader("Email Queue Management")
@@ -62,21 +185,21 @@ class EmailPreviewInterface:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            company_filter = st.selectbox(
+            st.selectbox(
                 "Filter by Company",
-                ["All"] + self._get_unique_companies(),
+                ["All"] + self._get_companies(),
                 key="email_queue_company_filter"
             )
         
         with col2:
-            template_filter = st.selectbox(
+            st.selectbox(
                 "Filter by Template",
                 ["All"] + self.template_manager.list_templates(),
                 key="email_queue_template_filter"
             )
         
         with col3:
-            min_score = st.slider(
+            st.slider(
                 "Min Personalization Score",
                 0.0, 1.0, 0.0, 0.1,
                 key="email_queue_min_score"
@@ -84,31 +207,19 @@ class EmailPreviewInterface:
         
         with col4:
             if st.button("🔄 Refresh Queue", key="email_queue_refresh"):
+                _clear_email_caches()
                 st.rerun()
         
-        # Get emails based on filters
-        emails = self._get_filtered_emails(company_filter, template_filter, min_score)
+        emails = self._get_queue_page_emails(reset_page=True)
+        page = st.session_state.get('email_queue_page', 1)
         
         if not emails:
             st.info("No emails found matching the current filters.")
             return
         
-        st.write(f"Found {len(emails)} emails in queue")
-        
-        # Email management actions
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("📝 Bulk Edit Selected", key="bulk_edit_emails"):
-                st.session_state['bulk_edit_mode'] = True
-        
-        with col2:
-            if st.button("📤 Mark Ready for Export", key="bulk_mark_ready"):
-                self._bulk_mark_ready_for_export()
-        
-        with col3:
-            if st.button("🗑️ Delete Selected", key="bulk_delete_emails"):
-                self._bulk_delete_emails()
+        total = emails[0]['total_count']
+        page_count = (total + EMAIL_QUEUE_PAGE_SIZE - 1) // EMAIL_QUEUE_PAGE_SIZE
+        st.write(f"Found {total} emails in queue")
         
         # Display emails in a data table with selection
         email_df = self._create_email_dataframe(emails)
@@ -154,19 +265,46 @@ class EmailPreviewInterface:
         # Handle status updates
         if not edited_df.equals(email_df):
             self._handle_email_status_updates(email_df, edited_df)
+        
+        if page_count > 1:
+            st.number_input("Page", min_value=1, max_value=page_count, key="email_queue_page")
+            st.caption(f"Page {page} of {page_count}")
+        
+        # Email management actions, below the table so they see its selection
+        selected_ids = [int(email_id) for email_id in edited_df.index[edited_df["Select"]]]
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            if st.button("📝 Bulk Edit Selected", key="bulk_edit_emails"):
+                st.session_state['bulk_edit_mode'] = True
+        
+        with col2:
+            if st.button("🤖 Regenerate Selected", key="bulk_regenerate_emails"):
+                self._bulk_regenerate_emails(selected_ids)
+        
+        with col3:
+            if st.button("📤 Mark Ready for Export", key="bulk_mark_ready"):
+                self._bulk_mark_ready_for_export(selected_ids)
+        
+        with col4:
+            if st.button("🗑️ Delete Selected", key="bulk_delete_emails"):
+                self._bulk_delete_emails(selected_ids)
+        
+        self._render_regeneration_outcome("regen_selected")
     
+    @st.fragment
     def _render_email_editor_tab(self):
         """Render the email editing tab."""
         st.subheader("Edit Email Content")
         
-        # Email selection
-        emails = self._get_all_emails()
+        # Email selection, from the page currently shown in the queue
+        emails = self._get_queue_page_emails()
         if not emails:
             st.info("No emails available for editing. Generate some emails first.")
             return
         
         # Email selector
-        email_options = [f"{email['company']} - {email['job_title']} ({email['contact_name']})" for email in emails]
+        email_options = self._email_options(emails)
         selected_email_idx = st.selectbox(
             "Select Email to Edit",
             range(len(email_options)),
@@ -194,17 +332,18 @@ class EmailPreviewInterface:
             # Body editor
             edited_body = st.text_area(
                 "Email Body",
-                value=email_data['body'],
+                value=self._get_email_body(email_data['id']),
                 height=400,
                 help="Edit the email body content"
             )
             
             # Template selector
+            templates = self.template_manager.list_templates()
             current_template = email_data.get('template_used', 'professional')
             new_template = st.selectbox(
                 "Email Template",
-                self.template_manager.list_templates(),
-                index=self.template_manager.list_templates().index(current_template) if current_template in self.template_manager.list_templates() else 0
+                templates,
+                index=templates.index(current_template) if current_template in templates else 0
             )
             
             # Additional options
@@ -230,6 +369,9 @@ class EmailPreviewInterface:
                     )
                     if success:
                         st.success("Email updated successfully!")
+                        if regenerate_option:
+                            # Scheduled once per submit; the checkbox keeps its value across reruns
+                            self._regenerate_email_with_ai(email_data['id'])
                         st.rerun()
                     else:
                         st.error("Failed to update email")
@@ -239,27 +381,25 @@ class EmailPreviewInterface:
                     st.rerun()
             
             with col3:
-                if st.form_submit_button("🤖 Regenerate with AI") or regenerate_option:
-                    with st.spinner("Regenerating email with AI..."):
-                        success = self._regenerate_email_with_ai(email_data['id'])
-                        if success:
-                            st.success("Email regenerated successfully!")
-                            st.rerun()
-                        else:
-                            st.error("Failed to regenerate email")
+                if st.form_submit_button("🤖 Regenerate with AI"):
+                    self._regenerate_email_with_ai(email_data['id'])
+        
+        # Progress of a regeneration running in the background (fragments can't live in forms)
+        self._render_regeneration_outcome(f"regen_{email_data['id']}")
     
+    @st.fragment
     def _render_email_preview_tab(self):
         """Render the email preview tab."""
         st.subheader("Email Preview")
         
-        # Email selection for preview
-        emails = self._get_all_emails()
+        # Email selection for preview, from the page currently shown in the queue
+        emails = self._get_queue_page_emails()
         if not emails:
             st.info("No emails available for preview.")
             return
         
         # Email selector
-        email_options = [f"{email['company']} - {email['job_title']} ({email['contact_name']})" for email in emails]
+        email_options = self._email_options(emails)
         selected_email_idx = st.selectbox(
             "Select Email to Preview",
             range(len(email_options)),
@@ -289,7 +429,8 @@ class EmailPreviewInterface:
         st.markdown("---")
         
         # Email preview with styling
-        email_html = self._format_email_as_html(email_data)
+        body = self._get_email_body(email_data['id'])
+        email_html = self._format_email_as_html(email_data, body)
         
         # Show both HTML preview and raw text
         preview_type = st.radio(
@@ -318,7 +459,7 @@ class EmailPreviewInterface:
         elif preview_type == "Plain Text":
             st.text_area(
                 "Email Content",
-                value=email_data['body'],
+                value=body,
                 height=400,
                 disabled=True
             )
@@ -344,6 +485,7 @@ class EmailPreviewInterface:
                 st.success("Email marked as ready for export!")
                 st.rerun()
     
+    @st.fragment
     def _render_export_ready_tab(self):
         """Render the export-ready emails tab."""
         st.subheader("Export-Ready Emails")
@@ -393,181 +535,364 @@ class EmailPreviewInterface:
                         self._remove_from_export_queue(email['id'])
                         st.rerun()
     
-    def _get_filtered_emails(self, company_filter: str, template_filter: str, min_score: float) -> List[Dict[str, Any]]:
-        """Get emails based on applied filters."""
+    def _get_filtered_emails(self, company_filter: str, template_filter: str, min_score: float,
+                             page: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get emails based on applied filters; one page of them if page is given."""
+        limit, offset = -1, 0
+        if page is not None:
+            limit, offset = EMAIL_QUEUE_PAGE_SIZE, (page - 1) * EMAIL_QUEUE_PAGE_SIZE
+        
         try:
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-            SELECT ge.*, j.title as job_title, j.company
-            FROM generated_emails ge
-            JOIN jobs j ON ge.job_id = j.id
-            WHERE 1=1
-            """
-            params = []
-            
-            if company_filter != "All":
-                query += " AND j.company = ?"
-                params.append(company_filter)
-            
-            if template_filter != "All":
-                query += " AND ge.template_used = ?"
-                params.append(template_filter)
-            
-            if min_score > 0:
-                query += " AND ge.personalization_score >= ?"
-                params.append(min_score)
-            
-            query += " ORDER BY ge.created_at DESC"
-            
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # Convert to dictionaries
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
-            
+            return _fetch_emails(
+                self.db_manager, str(self.db_manager.db_path),
+                company_filter, template_filter, min_score, limit, offset
+            )
         except Exception as e:
             st.error(f"Error retrieving emails: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
     
-    def _get_all_emails(self) -> List[Dict[str, Any]]:
-        """Get all generated emails."""
-        return self._get_filtered_emails("All", "All", 0.0)
+    def _get_email_body(self, email_id: int) -> str:
+        """Get the body of one email, which the email lists leave out."""
+        try:
+            return _fetch_email_body(self.db_manager, str(self.db_manager.db_path), email_id)
+        except Exception as e:
+            st.error(f"Error retrieving email body: {e}")
+            return ""
+    
+    def _email_options(self, emails: List[Dict[str, Any]]) -> List[str]:
+        """Selector labels for the emails, shared by the editor and preview tabs."""
+        # The ids and latest modification time identify this version of the list
+        signature = (
+            tuple(email['id'] for email in emails),
+            max(email.get('updated_at') or email.get('created_at') or '' for email in emails)
+        )
+        return _email_labels(signature, emails)
     
-    def _get_unique_companies(self) -> List[str]:
-        """Get unique company names from generated emails."""
+    def _get_companies(self) -> List[str]:
+        """Get the companies that have generated emails."""
         try:
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-            SELECT DISTINCT j.company
-            FROM generated_emails ge
-            JOIN jobs j ON ge.job_id = j.id
-            ORDER BY j.company
-            """)
-            
-            return [row[0] for row in cursor.fetchall()]
-            
+            return _fetch_companies(self.db_manager, str(self.db_manager.db_path))
         except Exception as e:
             st.error(f"Error retrieving companies: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
+    
+    def _get_queue_page_emails(self, reset_page: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the emails on the queue's current page, using its filter selections.
+        
+        Only the queue tab passes reset_page, since it runs before its page widget exists.
+        """
+        company_filter = st.session_state.get('email_queue_company_filter', "All")
+        template_filter = st.session_state.get('email_queue_template_filter', "All")
+        min_score = st.session_state.get('email_queue_min_score', 0.0)
+        
+        # Only the current page is fetched; start over if the filters left it out of range
+        page = st.session_state.get('email_queue_page', 1)
+        emails = self._get_filtered_emails(company_filter, template_filter, min_score, page)
+        if not emails and page > 1:
+            if reset_page:
+                st.session_state['email_queue_page'] = 1
+            emails = self._get_filtered_emails(company_filter, template_filter, min_score, 1)
+        return emails
     
     def _create_email_dataframe(self, emails: List[Dict[str, Any]]) -> pd.DataFrame:
         """Create a DataFrame for email display."""
-        data = []
-        
-        for email in emails:
-            data.append({
-                "Select": False,
-                "Job ID": email['job_id'],
-                "Subject": email['subject'][:50] + "..." if len(email['subject']) > 50 else email['subject'],
-                "Contact": email['contact_name'],
-                "Company": email['company'],
-                "Template": email.get('template_used', 'Unknown'),
-                "Personalization": email.get('personalization_score', 0),
-                "Status": "Draft",  # This could be stored in database
-                "Created": email.get('created_at', ''),
-            })
-        
-        return pd.DataFrame(data)
+        records = pd.DataFrame.from_records(emails, columns=[
+            'id', 'job_id', 'subject_short', 'contact_name', 'company',
+            'template_used', 'personalization_score', 'status', 'created_at'
+        ])
+        
+        # Whole-column operations instead of building a dict per email
+        email_df = pd.DataFrame({
+            "Select": False,
+            "Job ID": records['job_id'],
+            "Subject": records['subject_short'].fillna(''),  # Truncated in SQL
+            "Contact": records['contact_name'],
+            "Company": records['company'],
+            "Template": records['template_used'].fillna('Unknown'),
+            "Personalization": records['personalization_score'].fillna(0),
+            "Status": records['status'].fillna('draft').str.title(),
+            "Created": records['created_at'].fillna(''),
+        })
+        
+        # Indexed by email id (hidden in the table) for the bulk actions
+        email_df.index = records['id']
+        return email_df
     
     def _save_email_changes(self, email_id: int, subject: str, body: str, template: str, mark_ready: bool) -> bool:
         """Save changes to an email."""
         try:
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-            UPDATE generated_emails
-            SET subject = ?, body = ?, template_used = ?
-            WHERE id = ?
-            """, (subject, body, template, email_id))
-            
-            # If marking as ready, could add to a separate ready queue table
-            if mark_ready:
-                # Implementation would depend on your ready queue design
-                pass
+            # Pooled connection; the inner with block commits the update
+            with self.db_manager.connection() as conn, conn:
+                conn.execute("""
+                UPDATE generated_emails
+                SET subject = ?, body = ?, template_used = ?,
+                    updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now')
+                WHERE id = ?
+                """, (subject, body, template, email_id))
+                
+                if mark_ready:
+                    conn.execute("UPDATE generated_emails SET ready_for_export = 1 WHERE id = ?", (email_id,))
             
-            conn.commit()
+            _clear_email_caches()
             return True
             
         except Exception as e:
             st.error(f"Error saving email changes: {e}")
             return False
-        finally:
-            if conn:
-                conn.close()
     
     def _regenerate_email_with_ai(self, email_id: int) -> bool:
-        """Regenerate an email using AI."""
-        # This would involve getting the original job and contact data
-        # and regenerating the email with the current AI settings
+        """Start regenerating an email using AI; see _start_regeneration."""
+        return self._start_regeneration(f"regen_{email_id}", [email_id])
+    
+    def _bulk_regenerate_emails(self, email_ids: List[int]):
+        """Start regenerating the selected emails using AI."""
+        if not email_ids:
+            st.warning("Select emails in the table first.")
+            return
+        
+        self._start_regeneration("regen_selected", email_ids)
+    
+    def _start_regeneration(self, key: str, email_ids: List[int]) -> bool:
+        """
+        Start regenerating emails on the background event loop.
+        
+        The future is kept in session state under key and polled by
+        _render_regeneration_status.
+        """
+        if key in st.session_state:
+            return True
+        
         try:
-            # Implementation would involve:
-            # 1. Get original email data
-            # 2. Get job and contact information
-            # 3. Regenerate using EmailGenerator
-            # 4. Update the database
-            return True  # Simplified for now
+            st.session_state[key] = asyncio.run_coroutine_threadsafe(
+                self._aregenerate_emails(email_ids), get_event_loop()
+            )
+            return True
             
         except Exception as e:
             st.error(f"Error regenerating email: {e}")
             return False
     
-    def _format_email_as_html(self, email_data: Dict[str, Any]) -> str:
-        """Format email as HTML for preview."""
-        body_html = email_data['body'].replace('\n', '<br>')
+    async def _aregenerate_emails(self, email_ids: List[int]) -> int:
+        """
+        Regenerate emails in place from their job and contact details.
         
-        return f"""
-        <div style="margin-bottom: 20px;">
-            <strong>Subject:</strong> {email_data['subject']}
-        </div>
-        <div>
-            {body_html}
-        </div>
+        Rows are loaded with one query, generated concurrently and written
+        back in one transaction. Returns the number of emails regenerated.
         """
+        placeholders = ", ".join("?" * len(email_ids))
+        with self.db_manager.connection() as conn:
+            rows = conn.execute(f"""
+            SELECT ge.id, ge.job_id, ge.contact_email, ge.contact_name, ge.template_used,
+                   j.title as job_title, j.company, j.description
+            FROM generated_emails ge
+            JOIN jobs j ON ge.job_id = j.id
+            WHERE ge.id IN ({placeholders})
+            """, email_ids).fetchall()
+        
+        requests = [
+            EmailGenerationRequest(
+                job_id=row['job_id'],
+                job_title=row['job_title'],
+                company_name=row['company'],
+                job_description=row['description'] or "",
+                contact=Contact(name=row['contact_name'] or "", email=row['contact_email'], company=row['company']),
+                template_name=row['template_used'] or "professional"
+            )
+            for row in rows
+        ]
+        
+        # Replace the existing rows' content rather than storing new emails
+        emails = await self.email_generator.generate_many(requests, save=False)
+        updates = [
+            (email.subject, email.body, email.personalization_score, email.generation_notes, row['id'])
+            for row, email in zip(rows, emails)
+            if email is not None
+        ]
+        
+        if updates:
+            with self.db_manager.connection() as conn, conn:
+                conn.executemany("""
+                UPDATE generated_emails
+                SET subject = ?, body = ?, personalization_score = ?, generation_notes = ?,
+                    updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now')
+                WHERE id = ?
+                """, updates)
+        return len(updates)
+    
+    @st.fragment(run_every=1)
+    def _render_regeneration_status(self, key: str):
+        """Poll a background regeneration, reloading the emails once it finishes."""
+        future = st.session_state.get(key)
+        if future is None:
+            return
+        
+        if not future.done():
+            st.status("Regenerating with AI...", state="running")
+            return
+        
+        del st.session_state[key]
+        try:
+            if future.result():
+                _clear_email_caches()
+            else:
+                st.session_state[f"{key}_error"] = "Failed to regenerate email"
+        except Exception as e:
+            st.session_state[f"{key}_error"] = f"Error regenerating email: {e}"
+        
+        # The failure is shown by the app rerun; this fragment's next tick would clear it
+        st.rerun()
+    
+    def _render_regeneration_outcome(self, key: str):
+        """Show a regeneration's progress while it runs, or its error once it has failed."""
+        if key in st.session_state:
+            self._render_regeneration_status(key)
+        
+        error = st.session_state.pop(f"{key}_error", None)
+        if error:
+            st.error(error)
+    
+    def _format_email_as_html(self, email_data: Dict[str, Any], body: str) -> str:
+        """Format email as HTML for preview."""
+        version = email_data.get('updated_at') or email_data.get('created_at')
+        return _email_html(email_data['id'], version, email_data['subject'], body)
     
     def _mark_email_ready(self, email_id: int):
         """Mark an email as ready for export."""
-        # Implementation would add to ready queue
-        pass
+        self._update_emails("UPDATE generated_emails SET ready_for_export = 1 WHERE id IN ({})", [email_id])
     
     def _get_export_ready_emails(self) -> List[Dict[str, Any]]:
         """Get emails that are ready for export."""
-        # For now, return empty list - would need to implement ready queue
-        return []
+        try:
+            return _fetch_export_ready_emails(self.db_manager, str(self.db_manager.db_path))
+        except Exception as e:
+            st.error(f"Error retrieving export-ready emails: {e}")
+            return []
     
     def _export_emails(self, emails: List[Dict[str, Any]], format_type: str, include_metadata: bool):
         """Export emails in the specified format."""
-        # Implementation would handle different export formats
-        st.success(f"Exported {len(emails)} emails in {format_type} format!")
+        try:
+            buffer = io.BytesIO()
+            
+            if format_type == "Single CSV":
+                text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
+                writer = csv.writer(text)
+                columns = list(EXPORT_COLUMNS if include_metadata else EXPORT_COLUMNS[:5])
+                writer.writerow(columns)
+                writer.writerows(tuple(row[column] for column in columns) for row in self._iter_export_rows())
+                text.flush()
+                text.detach()
+                file_name, mime = "emails.csv", "text/csv"
+            elif format_type == "Email Client Format":
+                # One mbox file imports straight into Thunderbird, Apple Mail, etc.
+                generator = BytesGenerator(buffer, mangle_from_=True)
+                for row in self._iter_export_rows():
+                    message = self._export_message(row, include_metadata)
+                    message.set_unixfrom(f"From {row['contact_email']} {datetime.now():%a %b %d %H:%M:%S %Y}")
+                    generator.flatten(message, unixfrom=True)
+                    buffer.write(b"\n")
+                file_name, mime = "emails.mbox", "application/mbox"
+            else:
+                # Each row is compressed into the archive as it comes off the cursor
+                with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+                    for row in self._iter_export_rows():
+                        zf.writestr(f"{row['id']}.eml", self._export_message(row, include_metadata).as_bytes())
+                file_name, mime = "emails.zip", "application/zip"
+            
+            st.download_button(
+                f"⬇️ Download {file_name}",
+                buffer.getvalue(),
+                file_name=file_name,
+                mime=mime,
+                on_click="ignore",
+                key="download_export"
+            )
+            st.success(f"Exported {len(emails)} emails in {format_type} format!")
+        except Exception as e:
+            st.error(f"Error exporting emails: {e}")
+    
+    def _iter_export_rows(self):
+        """Yield export-ready emails straight from the cursor, one row at a time."""
+        with self.db_manager.connection() as conn:
+            yield from conn.execute(_EXPORT_EMAILS_SQL)
+    
+    @staticmethod
+    def _export_message(row, include_metadata: bool) -> EmailMessage:
+        """Build an RFC 822 message for one exported email row."""
+        message = EmailMessage()
+        message["To"] = formataddr((row["contact_name"] or "", row["contact_email"]))
+        message["Subject"] = row["subject"]
+        if include_metadata:
+            message["X-Job-Title"] = row["job_title"]
+            message["X-Company"] = row["company"]
+            message["X-Template"] = row["template_used"] or "Unknown"
+            message["X-Personalization-Score"] = f"{row['personalization_score'] or 0:.2f}"
+            message["X-Created-At"] = str(row["created_at"])
+        message.set_content(row["body"])
+        return message
     
     def _remove_from_export_queue(self, email_id: int):
         """Remove an email from the export queue."""
-        # Implementation would remove from ready queue
-        pass
+        self._update_emails("UPDATE generated_emails SET ready_for_export = 0 WHERE id IN ({})", [email_id])
     
     def _handle_email_status_updates(self, original_df: pd.DataFrame, edited_df: pd.DataFrame):
         """Handle status updates from the editable dataframe."""
-        # Compare dataframes and update database accordingly
-        pass
+        changed = edited_df["Status"].ne(original_df["Status"])
+        # "Ready" is the export flag; a ready email is still an unsent draft
+        updates = []
+        for email_id, status in edited_df.loc[changed, "Status"].items():
+            status = (status or "Draft").lower()
+            ready = status == "ready"
+            updates.append((int(ready), "draft" if ready else status, int(email_id)))
+        if not updates:
+            return
+        
+        try:
+            # All status changes go in one statement batch and one commit
+            with self.db_manager.connection() as conn, conn:
+                conn.executemany(
+                    "UPDATE generated_emails SET ready_for_export = ?, status = ? WHERE id = ?", updates
+                )
+            _clear_email_caches()
+        except Exception as e:
+            st.error(f"Error updating email status: {e}")
+    
+    def _update_emails(self, statement: str, email_ids: List[int]) -> bool:
+        """Run a statement with an "IN ({})" placeholder over the given email ids in one transaction."""
+        try:
+            placeholders = ", ".join("?" * len(email_ids))
+            with self.db_manager.connection() as conn, conn:
+                conn.execute(statement.format(placeholders), email_ids)
+            
+            _clear_email_caches()
+            # Rows have changed, so drop the table's pending edits and selection
+            st.session_state.pop("email_queue_editor", None)
+            return True
+        except Exception as e:
+            st.error(f"Error updating emails: {e}")
+            return False
     
-    def _bulk_mark_ready_for_export(self):
+    def _bulk_mark_ready_for_export(self, email_ids: List[int]):
         """Mark selected emails as ready for export."""
-        st.success("Selected emails marked as ready for export!")
+        if not email_ids:
+            st.warning("Select emails in the table first.")
+            return
+        
+        if self._update_emails(
+            "UPDATE generated_emails SET ready_for_export = 1 WHERE id IN ({})", email_ids
+        ):
+            st.success(f"{len(email_ids)} emails marked as ready for export!")
+            st.rerun()
     
-    def _bulk_delete_emails(self):
+    def _bulk_delete_emails(self, email_ids: List[int]):
         """Delete selected emails."""
-        st.success("Selected emails deleted!")
+        if not email_ids:
+            st.warning("Select emails in the table first.")
+            return
+        
+        if self._update_emails("DELETE FROM generated_emails WHERE id IN ({})", email_ids):
+            st.success(f"{len(email_ids)} emails deleted!")
+            st.rerun()
 
 def render_email_preview_interface(db_manager: DatabaseManager):
     """Render the email preview interface."""
@@ -7,12 +7,13 @@ Users can view job details, filtering analysis, and make final decisions on job
 
 import streamlit as st
 import pandas as pd
+import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 import json
 
 from ...config.database import DatabaseManager
-from ...ai_processing import AIJobFilter, FilterDecision, FilterCriteria, create_default_criteria
+from ...ai_processing import AIJobFilter, FilterDecision, FilterCriteria, create_default_criteria, get_llm_manager
 from ...scrapers import LinkedInRSScraper
 from ..utils.styling import apply_custom_css
 
@@ -417,12 +418,21 @@ class JobReviewInterface:
                         # For now, we'll filter recent jobs
                         recent_jobs = self._get_recent_unfiltered_jobs()
                         if recent_jobs:
-                            import asyncio
-                            filter_results = asyncio.run(
+                            filter_results = self._run_async(
                                 self.job_filter.filter_and_save_jobs(recent_jobs, criteria)
                             )
                             st.success(f"Filtered {filter_results['analyzed_jobs']} jobs")
     
+    def _run_async(self, coro):
+        """Run a job filter coroutine, closing the LLM sessions it opened before its loop ends."""
+        async def run():
+            try:
+                return await coro
+            finally:
+                await asyncio.gather(self.job_filter.llm_manager.aclose(), get_llm_manager().aclose())
+        
+        return asyncio.run(run())
+    
     def _get_jobs_with_filter_results(self, decision_filter: str, min_confidence: float, days_back: int) -> List[Dict[str, Any]]:
         """Get jobs with their filter results."""
         try:
@@ -476,7 +486,7 @@ class JobReviewInterface:
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def _load_filter_criteria(self) -> FilterCriteria:
         """Load filter criteria from database or return default."""
@@ -506,7 +516,7 @@ class JobReviewInterface:
             st.error(f"Error loading filter criteria: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
         
         return create_default_criteria()
     
@@ -548,7 +558,7 @@ class JobReviewInterface:
             st.error(f"Error saving filter criteria: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def _update_job_decision(self, job_id: int, decision: str):
         """Update job decision in database."""
@@ -568,14 +578,13 @@ class JobReviewInterface:
             st.error(f"Error updating job decision: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def _reanalyze_job(self, job_id: int):
         """Re-analyze a job with current filter criteria."""
         try:
             criteria = self._load_filter_criteria()
-            import asyncio
-            asyncio.run(self.job_filter.filter_and_save_jobs([job_id], criteria))
+            self._run_async(self.job_filter.filter_and_save_jobs([job_id], criteria))
         except Exception as e:
             st.error(f"Error re-analyzing job: {e}")
     
@@ -607,7 +616,7 @@ class JobReviewInterface:
             st.error(f"Error getting filter statistics: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
         
         return None
     
@@ -627,7 +636,7 @@ class JobReviewInterface:
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def _get_recent_unfiltered_jobs(self) -> List[int]:
         """Get IDs of recent jobs that haven't been filtered yet."""
@@ -652,7 +661,7 @@ class JobReviewInterface:
             return []
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     def _test_filter_criteria(self):
         """Test current filter criteria on recent jobs."""
@@ -667,8 +676,7 @@ class JobReviewInterface:
             # Take first 5 jobs for testing
             test_jobs = recent_jobs[:5]
             
-            import asyncio
-            results = asyncio.run(
+            results = self._run_async(
                 self.job_filter.filter_jobs_batch(test_jobs, criteria)
             )
             
@@ -0,0 +1,24 @@
+"""
+Background event loop shared by the Streamlit tabs.
+
+Async work (LLM provider tests, AI email regeneration) is submitted here with
+asyncio.run_coroutine_threadsafe so it never blocks the script thread.
+"""
+
+import asyncio
+import threading
+
+import streamlit as st
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop running in a daemon thread for the life of the process.
+    
+    One loop serves every tab, so provider sessions stay bound to it and
+    their pooled connections (DNS, TLS) are reused across tests, regenerations
+    and reruns.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="ui-event-loop", daemon=True).start()
+    return loop
@@ -70,9 +70,6 @@ def init_session_state():
     if 'show_job_details' not in st.session_state:
         st.session_state.show_job_details = False
     
-    if 'refresh_data' not in st.session_state:
-        st.session_state.refresh_data = False
-    
     if 'last_refresh' not in st.session_state:
         st.session_state.last_refresh = None
 
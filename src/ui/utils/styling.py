@@ -4,8 +4,18 @@ Custom CSS styling for the Streamlit application.
 This module provides consistent styling and theming across all UI components.
 """
 
+from html import escape
+
 import streamlit as st
 
+# Metric card markup, formatted once per card with the escaped variable parts
+_METRIC_TEMPLATE = (
+    '<div class="metric-card">'
+    '<div class="metric-value {status_class}">{value}</div>'
+    '<div class="metric-label">{label}</div>'
+    '</div>'
+)
+
 def apply_custom_css():
     """Apply custom CSS styling to the Streamlit application."""
     
@@ -99,6 +109,14 @@ def apply_custom_css():
         box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
     }
     
+    /* Equal-width row of metric cards emitted as one element */
+    .metric-row {
+        display: grid;
+        grid-auto-flow: column;
+        grid-auto-columns: 1fr;
+        gap: 1rem;
+    }
+    
     .metric-value {
         font-size: 2rem;
         font-weight: 700;
@@ -241,17 +259,12 @@ def apply_custom_css():
     """, unsafe_allow_html=True)
 
 def create_metric_card(value, label, status=None):
-    """Create a styled metric card."""
-    status_class = ""
-    if status:
-        status_class = f"status-{status}"
-    
-    return f"""
-    <div class="metric-card">
-        <div class="metric-value {status_class}">{value}</div>
-        <div class="metric-label">{label}</div>
-    </div>
-    """
+    """Create a styled metric card. value and label are plain text and are HTML-escaped."""
+    return _METRIC_TEMPLATE.format(
+        value=escape(str(value)),
+        label=escape(str(label)),
+        status_class=f"status-{escape(status)}" if status else ""
+    )
 
 def create_info_card(title, content):
     """Create a styled information card."""
@@ -559,7 +559,7 @@ class WorkflowOrchestrator:
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def _get_existing_filter_result(self, job_id: int) -> Optional[str]:
         """Get existing filter result for a job."""
@@ -582,7 +582,7 @@ class WorkflowOrchestrator:
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def _load_default_filter_criteria(self) -> FilterCriteria:
         """Load default filter criteria."""
@@ -655,7 +655,7 @@ class WorkflowOrchestrator:
             logger.error(f"Error saving batch result: {e}")
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
     
     async def get_batch_result(self, request_id: str) -> Optional[BatchProcessingResult]:
         """Get batch processing result by request ID."""
@@ -708,7 +708,7 @@ class WorkflowOrchestrator:
             return None
         finally:
             if conn:
-                conn.close()
+                self.db_manager.release_connection(conn)
 
 async def process_accepted_jobs(
     db_manager: Optional[DatabaseManager] = None,
@@ -750,7 +750,7 @@ async def process_accepted_jobs(
         job_ids = []
     finally:
         if conn:
-            conn.close()
+            db_manager.release_connection(conn)
     
     if not job_ids:
         logger.warning("No accepted jobs found for processing")